@@ -2,6 +2,7 @@ from flask import Flask, request,render_template, session, redirect, url_for, Re
 # from src.logger import logging
 # from src.pipeline.event_pipeline import eventPipeline
 from src.logger import logging 
+from event_scraper.urls import canonical_url, event_key
 # import concurrent.futures # new
 # import uuid # new
 import json 
@@ -60,7 +61,9 @@ def index():
             url = request.form.get('URL', '').strip()
             if url:
                 urls = session['event_urls']
-                urls.append(url)
+                # Ignore links to an event that is already in the list
+                if event_key(url) not in {event_key(u) for u in urls}:
+                    urls.append(canonical_url(url))
                 session['event_urls'] = urls
 
         elif action == 'clear_list':
@@ -89,21 +92,18 @@ def index():
  
             def run_pipeline(u, q, total):
                 try:
-                    for index, url in enumerate(u, 1):
+                    def report(index, total, url, status):
                         q.put({
                             "index": index,
                             "total": total,
                             "url": url,
-                            "status": "processing"
-
-                        })
-                        eventPipeline([url])
-                        q.put({
-                            "index": index,
-                            "total": total,
-                            "url": url,
-                            "status": "done"
+                            "status": status
                         })
+
+                    # One run for the whole list, so its pages are scraped
+                    # concurrently and its writes share batches; each URL is
+                    # reported under its own row as it starts and finishes
+                    eventPipeline(u, progress=report)
                 except Exception:
                     logging.exception("eventPipeline failed")
                     q.put({"error": True, "done": True})
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Build the local venue gazetteer used before Google Places lookups.
+Usage: python build_gazetteer.py [--no-firestore] [--output PATH]
+
+Venues come from the Firestore whatstheplace collection and from every
+place found by earlier Places lookups (.places_cache.sqlite), indexed under
+both the Places name and the venue string that was looked up.
+"""
+
+import argparse
+
+from event_scraper.gazetteer import DEFAULT_GAZETTEER_PATH, VenueGazetteer, candidate_from_establishment
+from event_scraper.places_cache import get_places_cache
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--output', default=DEFAULT_GAZETTEER_PATH)
+    parser.add_argument('--no-firestore', action='store_true', help="only use cached Places results")
+    args = parser.parse_args()
+
+    gazetteer = VenueGazetteer()
+
+    if not args.no_firestore:
+        from src.components.base_functions.initialize_firebase import initialize_firebase
+        db = initialize_firebase()
+        venues = 0
+        for doc in db.collection("whatstheplace").stream():
+            venue = doc.to_dict()
+            if venue.get('id') and venue.get('displayName'):
+                gazetteer.add(venue['displayName'], candidate_from_establishment(venue))
+                venues += 1
+        print(f"Read {venues} venues from whatstheplace")
+
+    lookups = 0
+    for name, place_info in get_places_cache().found_places():
+        gazetteer.add(name, place_info['candidates'][0])
+        lookups += 1
+    print(f"Read {lookups} cached Places lookups")
+
+    gazetteer.save(args.output)
+    print(f"Wrote {len(gazetteer)} venues under {sum(1 for _ in gazetteer.names())} names to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
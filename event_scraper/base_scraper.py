@@ -1,28 +1,63 @@
+import asyncio
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from concurrent.futures import Executor, ThreadPoolExecutor
 from urllib.parse import urlparse
-from typing import Optional
+from typing import Optional, Iterable, AsyncIterator, Tuple, Callable
 from .models import EventDetails
+from .parsed_page import ParsedPage
+from .singleflight import SingleFlight
+from .specs import PlatformSpec
+from .transport import HttpTransport, get_transport
+from .urls import canonical_url, event_key
+
+# Upper bound on event pages fetched at the same time by extract_many.
+DEFAULT_MAX_CONCURRENCY = 20
+
+# Bump when extraction output changes so EventDetails parsed by older code
+# and memoised in the HTTP cache are not reused.
+PARSE_CACHE_VERSION = 7
+
+# Concurrent scrapes of the same event share one fetch and parse.
+_inflight_scrapes = SingleFlight()
 
 class BaseScraper:
     """Base class for all scrapers."""
     
-    def __init__(self):
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept-Language': 'en-US,en;q=0.9',
-        }
+    # Whether the parsed EventDetails can be memoised against the cached event
+    # page. Scrapers that read something other than the event URL (an API)
+    # turn this off.
+    caches_parsed_pages = True
+    
+    # Timeout for the event page request; None uses the transport's default.
+    fetch_timeout: Optional[float] = None
+    
+    # Compiled XPath selectors for the selector-driven fields, read with
+    # ParsedPage.select().
+    spec: Optional[PlatformSpec] = None
+    
+    def __init__(self, transport: Optional[HttpTransport] = None):
+        self.transport = transport or get_transport()
+        self.headers = self.transport.headers
     
     def get_page_content(self, url: str) -> Optional[str]:
         """Fetch the HTML content of a webpage."""
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self.transport.get(url)
             response.raise_for_status()
             return response.text
         except requests.RequestException as e:
             print(f"Error fetching {url}: {e}")
             return None
     
+    def make_soup(self, markup, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """Parse a secondary page (not the event page) with lxml, keeping only the given subtrees."""
+        return BeautifulSoup(markup, 'lxml', parse_only=parse_only)
+    
+    def parse_page(self, markup, url: Optional[str] = None) -> ParsedPage:
+        """Wrap event page markup in a ParsedPage."""
+        return ParsedPage(markup, url)
+    
     def extract_event_details(self, url: str) -> Optional[EventDetails]:
         """
         Extract event details from the given URL.
@@ -30,8 +65,115 @@ class BaseScraper:
         """
         raise NotImplementedError("Subclasses must implement this method")
     
+    def scrape(self, url: str) -> Optional[EventDetails]:
+        """
+        Extract event details, reusing the EventDetails already parsed from
+        the cached page when it is still fresh or the server answers 304, so
+        an unchanged page skips both the download and the parse. Callers
+        scraping the same event at the same time share one fetch and parse and
+        receive the same EventDetails.
+        The URL is canonicalised first, so tracking parameters and fragments
+        never produce a second fetch of the same page.
+        """
+        url = canonical_url(url)
+        return _inflight_scrapes.do((type(self).__name__, event_key(url)), self._scrape, url)
+    
+    def _scrape(self, url: str) -> Optional[EventDetails]:
+        cache = self.transport.cache
+        if cache is None or not self.caches_parsed_pages:
+            return self.extract_event_details(url)
+        
+        kwargs = {'timeout': self.fetch_timeout} if self.fetch_timeout else {}
+        try:
+            response = self.transport.revalidate(url, **kwargs)
+        except requests.RequestException as e:
+            # Retries are spent or the circuit is open; fetching the page
+            # again from extract_event_details would only fail again
+            print(f"Error fetching {url}: {e}")
+            return None
+        if response is None:
+            return self.extract_event_details(url)
+        digest = getattr(response, 'cache_digest', None)
+        if digest is None:
+            print(f"Error fetching {url}: HTTP {response.status_code}")
+            return None
+        
+        # The page is now fresh in the cache, so extract_event_details
+        # reads it from disk instead of fetching it again
+        parser_key = f"{type(self).__name__}:{PARSE_CACHE_VERSION}"
+        parsed = cache.load_parsed(url, digest, parser_key)
+        if parsed is not None:
+            return EventDetails.model_validate_json(parsed)
+        
+        event_details = self.extract_event_details(url)
+        if event_details is not None:
+            cache.store_parsed(url, digest, parser_key, event_details.model_dump_json())
+        return event_details
+    
+    async def aextract_event_details(self, url: str,
+                                     semaphore: Optional[asyncio.Semaphore] = None,
+                                     executor: Optional[Executor] = None,
+                                     on_started: Optional[Callable[[str], None]] = None) -> Optional[EventDetails]:
+        """
+        Async counterpart of scrape.
+        The blocking fetch and the _extract_* parsing run unchanged on a worker
+        thread, so sync and async modes produce identical EventDetails.
+        on_started(url), if given, is called once the page gets a slot.
+        """
+        loop = asyncio.get_running_loop()
+        if semaphore is None:
+            if on_started is not None:
+                on_started(url)
+            return await loop.run_in_executor(executor, self.scrape, url)
+        async with semaphore:
+            if on_started is not None:
+                on_started(url)
+            return await loop.run_in_executor(executor, self.scrape, url)
+    
+    @classmethod
+    async def extract_many(cls, urls: Iterable[str],
+                           max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                           transport: Optional[HttpTransport] = None,
+                           on_started: Optional[Callable[[str], None]] = None
+                           ) -> AsyncIterator[Tuple[str, Optional[EventDetails]]]:
+        """
+        Extract many event pages concurrently, yielding (url, EventDetails)
+        pairs in completion order. The details are None when a URL fails.
+        Called on BaseScraper the scraper is picked per URL, called on a
+        subclass every URL goes to that subclass. on_started(url), if given,
+        is called as each page's fetch begins, i.e. once it gets one of the
+        max_concurrency slots.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        
+        async def extract(url: str) -> Tuple[str, Optional[EventDetails]]:
+            try:
+                if cls is BaseScraper:
+                    scraper = cls.get_scraper_for_url(url, transport)
+                else:
+                    scraper = cls(transport)
+            except ValueError as e:
+                print(f"Error: {e}")
+                return url, None
+            try:
+                return url, await scraper.aextract_event_details(url, semaphore, executor, on_started)
+            except Exception as e:
+                # One failing page must not end the batch
+                print(f"Error extracting {url}: {e}")
+                return url, None
+        
+        tasks = [asyncio.ensure_future(extract(url)) for url in urls]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+            executor.shutdown(wait=False)
+    
     @staticmethod
-    def get_scraper_for_url(url: str) -> 'BaseScraper':
+    def get_scraper_for_url(url: str, transport: Optional[HttpTransport] = None) -> 'BaseScraper':
         """Factory method to get the appropriate scraper for the given URL."""
         from .webtickets_scraper import WebticketsScraper
         from .computicket_scraper import ComputicketScraper
@@ -42,14 +184,14 @@ class BaseScraper:
         domain = urlparse(url).netloc.lower()
         
         if 'webtickets.co.za' in domain:
-            return WebticketsScraper()
+            return WebticketsScraper(transport)
         elif 'computicket.com' in domain or 'computicket-boxoffice.com' in domain:
-            return ComputicketScraper()
+            return ComputicketScraper(transport)
         elif 'quicket.co.za' in domain:
-            return QuicketScraper()
+            return QuicketScraper(transport)
         elif 'howler.co.za' in domain:
-            return HowlerScraper()
+            return HowlerScraper(transport)
         elif 'ticketpro.co.za' in domain or 'ticketproshop.co.za' in domain:
-            return TicketproScraper()
+            return TicketproScraper(transport)
         else:
             raise ValueError(f"No scraper available for URL: {url}")
@@ -0,0 +1,222 @@
+"""
+Date and time parsing shared by the scrapers and the *_function extractors.
+
+Every pattern is compiled once at import, month and weekday names go through
+a plain dict instead of strptime('%b'), and the string parsers are wrapped
+in an LRU cache because the same date strings recur across the ticket
+panels of a page and across pages of a run. Parsed values are naive South
+African wall-clock times, as the scrapers have always returned them;
+to_sast() attaches the +02:00 offset when a record is written.
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Optional, Tuple
+
+SAST = timezone(timedelta(hours=2), 'SAST')
+
+MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'sept': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'june': 6, 'july': 7,
+    'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12,
+}
+WEEKDAYS = {
+    'mon': 0, 'tue': 1, 'wed': 2, 'thu': 3, 'fri': 4, 'sat': 5, 'sun': 6,
+    'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3, 'friday': 4,
+    'saturday': 5, 'sunday': 6,
+}
+
+# Webtickets: "06 Dec 2025 12:00"
+DAY_MONTH_YEAR_TIME_RE = re.compile(r'(\d{1,2})\s+(\w{3})\s+(\d{4})\s+(\d{1,2}):(\d{2})')
+# Computicket: "Sat 29 Nov 2025, 12:00 PM", "Sat 29 Nov 2025, 18:00", "Sat 29 Nov 2025"
+COMPUTICKET_DATETIME_RE = re.compile(r'\w{3}\s+\d{1,2}\s+\w{3}\s+\d{4},\s+\d{1,2}:\d{2}\s*(?:AM|PM)?')
+COMPUTICKET_RANGE_RE = re.compile(
+    r'(\w{3}\s+\d{1,2}\s+\w{3}\s+\d{4},\s+\d{1,2}:\d{2}\s*(?:AM|PM)?)\s*-\s*'
+    r'(\w{3}\s+\d{1,2}\s+\w{3}\s+\d{4},\s+\d{1,2}:\d{2}\s*(?:AM|PM)?)')
+COMPUTICKET_DATE_RE = re.compile(r'\w{3}\s+\d{1,2}\s+\w{3}\s+\d{4}')
+COMPUTICKET_PARTS_RE = re.compile(
+    r'^(\w{3})\s+(\d{1,2})\s+(\w{3})\s+(\d{4})(?:,\s+(\d{1,2}):(\d{2})(?:\s*(AM|PM))?)?$')
+# "Date: March 8th, 2025"
+LONG_DATE_RE = re.compile(r'^([A-Za-z]+)\s+(\d{1,2})(?:st|nd|rd|th)?,\s*(\d{4})$')
+# Ticketpro: "Dec 06", "12/06/2025", "1:00 PM - 11:59 PM"
+MONTH_DAY_RE = re.compile(r'(\w{3})\s+(\d{1,2})')
+US_DATE_RE = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})')
+TIME_12H_RE = re.compile(r'(\d{1,2}):(\d{2})\s*(AM|PM)')
+TIME_RANGE_12H_RE = re.compile(r'(\d{1,2}:\d{2}\s*(?:AM|PM))\s*[-–]\s*(\d{1,2}:\d{2}\s*(?:AM|PM))')
+# Howler: "13:00 8 Mar 2025 - 02:00 9 Mar 2025 SAST (+02:00)", or the times
+# "13:00 - 23:00 SAST (+02:00)" with the day in "8 Mar 2025 SAST (+02:00)"
+HOWLER_RANGE_RE = re.compile(r'(\d{2}):(\d{2}) (\d{1,2}) (\w{3}) (\d{4}) - (\d{2}):(\d{2}) (\d{1,2}) (\w{3}) (\d{4})')
+HOWLER_TIMES_RE = re.compile(r'(\d{2}):(\d{2})\s*-\s*(\d{2}):(\d{2})\s*SAST\s*\(\+02:00\)')
+HOWLER_DAY_RE = re.compile(r'(\d{1,2})\s+([A-Za-z]{3})\s*(\d{4})?\s*SAST\s*\(\+02:00\)')
+
+CACHE_SIZE = 4096
+
+
+def month_number(name: str) -> Optional[int]:
+    """1-12 for an English month name or abbreviation, any case."""
+    return MONTHS.get(name.lower())
+
+
+def _datetime(year: int, month: Optional[int], day: int, hour: int = 0, minute: int = 0) -> Optional[datetime]:
+    if month is None:
+        return None
+    try:
+        return datetime(year, month, day, hour, minute)
+    except ValueError:
+        return None
+
+
+def _hour_12(hour: int, meridiem: str) -> Optional[int]:
+    if not 1 <= hour <= 12:
+        return None
+    if meridiem.upper() == 'AM':
+        return 0 if hour == 12 else hour
+    return 12 if hour == 12 else hour + 12
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_iso(value: str) -> Optional[datetime]:
+    """ISO 8601 date or datetime as a naive SAST time."""
+    if not isinstance(value, str):
+        return None
+    value = value.strip()
+    if not value:
+        return None
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(SAST).replace(tzinfo=None)
+    return parsed
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_day_month_year_time(value: str) -> Optional[datetime]:
+    """'06 Dec 2025 12:00' (day, abbreviated month, year, 24-hour time)."""
+    match = DAY_MONTH_YEAR_TIME_RE.fullmatch(value.strip())
+    if not match:
+        return None
+    day, month, year, hour, minute = match.groups()
+    if len(month) != 3:
+        return None
+    return _datetime(int(year), month_number(month), int(day), int(hour), int(minute))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_computicket_datetime(value: str) -> Optional[datetime]:
+    """
+    'Sat 29 Nov 2025, 12:00 PM', 'Sat 29 Nov 2025, 18:00' or
+    'Sat 29 Nov 2025'. A 24-hour time followed by PM ('18:00 PM') is read as
+    24-hour.
+    """
+    match = COMPUTICKET_PARTS_RE.match(value.strip())
+    if not match:
+        return None
+    weekday, day, month, year, hour, minute, meridiem = match.groups()
+    if weekday.lower() not in WEEKDAYS or len(month) != 3:
+        return None
+    if hour is None:
+        return _datetime(int(year), month_number(month), int(day))
+    hour = int(hour)
+    if meridiem and not (meridiem == 'PM' and hour >= 13):
+        hour = _hour_12(hour, meridiem)
+        if hour is None:
+            return None
+    return _datetime(int(year), month_number(month), int(day), hour, int(minute))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_long_date(value: str) -> Optional[datetime]:
+    """'March 8th, 2025' (full month name, optional ordinal suffix)."""
+    match = LONG_DATE_RE.match(value.strip())
+    if not match:
+        return None
+    month, day, year = match.groups()
+    return _datetime(int(year), month_number(month), int(day))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_time_12h(value: str) -> Optional[Tuple[int, int]]:
+    """(hour, minute) of a '1:00 PM' style time."""
+    match = TIME_12H_RE.fullmatch(value.strip())
+    if not match:
+        return None
+    hour = _hour_12(int(match.group(1)), match.group(3))
+    minute = int(match.group(2))
+    if hour is None or minute > 59:
+        return None
+    return hour, minute
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_month_day(value: str, year: int) -> Optional[datetime]:
+    """'Dec 06' in the given year."""
+    match = MONTH_DAY_RE.fullmatch(value.strip())
+    if not match or len(match.group(1)) != 3:
+        return None
+    return _datetime(year, month_number(match.group(1)), int(match.group(2)))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_us_date(value: str) -> Optional[datetime]:
+    """'12/06/2025' as month/day/year."""
+    match = US_DATE_RE.fullmatch(value.strip())
+    if not match:
+        return None
+    month, day, year = (int(part) for part in match.groups())
+    return _datetime(year, month, day)
+
+
+def parse_howler_dates(date_string: str, alt_date: str) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """
+    Start and end of a Howler event from the event bar's date link and
+    heading. The link holds either the full range or only the times, in
+    which case the day comes from the heading (current year if omitted).
+    """
+    return _parse_howler_dates(date_string, alt_date, datetime.now().year)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse_howler_dates(date_string: str, alt_date: str,
+                        current_year: int) -> Tuple[Optional[datetime], Optional[datetime]]:
+    match = HOWLER_RANGE_RE.search(date_string)
+    if match:
+        (start_hour, start_minute, start_day, start_month, start_year,
+         end_hour, end_minute, end_day, end_month, end_year) = match.groups()
+        start = _datetime(int(start_year), month_number(start_month), int(start_day),
+                          int(start_hour), int(start_minute))
+        end = _datetime(int(end_year), month_number(end_month), int(end_day),
+                        int(end_hour), int(end_minute))
+        if start is None or end is None:
+            return None, None
+        return start, end
+
+    time_match = HOWLER_TIMES_RE.search(date_string)
+    day_match = HOWLER_DAY_RE.search(alt_date)
+    if not time_match or not day_match:
+        return None, None
+    start_hour, start_minute, end_hour, end_minute = (int(part) for part in time_match.groups())
+    day, month, year = day_match.groups()
+    year = int(year) if year else current_year
+    start = _datetime(year, month_number(month), int(day), start_hour, start_minute)
+    end = _datetime(year, month_number(month), int(day), end_hour, end_minute)
+    if start is None or end is None:
+        return None, None
+    return start, end
+
+
+def to_sast(value: Optional[datetime]) -> Optional[datetime]:
+    """
+    Timezone-aware SAST datetime to the minute, as the Firestore records
+    store it. Naive values are taken to be SAST wall-clock times already.
+    """
+    if value is None:
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(SAST)
+    return value.replace(second=0, microsecond=0, tzinfo=SAST)
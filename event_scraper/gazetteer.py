@@ -0,0 +1,216 @@
+"""
+Local venue gazetteer with fuzzy name matching.
+
+Scraped venue names come in many spellings ("Ticketpro Dome",
+"TicketPro Dome, Northriding"), so an exact-key cache misses most of them.
+The gazetteer holds every known venue (the whatstheplace collection plus
+earlier Places answers) under each name it has been seen with, and indexes
+the word trigrams of those names, pg_trgm style. A lookup scores the names
+sharing trigrams with the query by how much each covers of the other, so
+"Baxter Theatre, Cape Town" does not match "Cape Town" just by containing
+it; only a confident best match is returned, so anything else still goes
+to Google Places. Places that are a city or suburb rather than a venue
+only match their own name exactly.
+
+The index is built offline by build_gazetteer.py and saved as JSON.
+"""
+
+import json
+import os
+import re
+import tempfile
+import threading
+from collections import defaultdict
+from typing import Optional, Any, Dict, Iterable, List, Tuple
+
+from .http_cache import PROJECT_ROOT
+from .places_cache import normalise_venue
+
+DEFAULT_GAZETTEER_PATH = os.path.join(PROJECT_ROOT, '.venue_gazetteer.json')
+
+# Share of both names' trigrams a match needs before Places is skipped.
+MATCH_THRESHOLD = 0.75
+# Places types of a city, suburb or region rather than a venue.
+LOCALITY_TYPES = frozenset({'locality', 'sublocality', 'sublocality_level_1', 'neighborhood', 'postal_town',
+                            'administrative_area_level_1', 'administrative_area_level_2', 'country',
+                            'colloquial_area', 'political'})
+# Street numbers and postal codes, which a city's address lacks.
+DIGIT_RE = re.compile(r'\d')
+# Names shorter than this many trigrams ("Dome") are too generic to match on.
+MIN_TRIGRAMS = 6
+# Words that say nothing about which venue is meant.
+STOP_WORDS = frozenset({'the', 'a', 'an', 'at', 'and', 'of', 'on', 'in'})
+
+
+def trigrams(key: str) -> frozenset:
+    """Word trigrams of a normalised name, each word padded as '  word '."""
+    grams = set()
+    for word in key.split():
+        if word in STOP_WORDS:
+            continue
+        padded = f'  {word} '
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+def is_locality(candidate: Dict[str, Any]) -> bool:
+    """
+    Whether a Places candidate is a city or suburb ("Cape Town") rather
+    than a venue. Answers cached before types were requested are judged by
+    their address: a bare place's address starts with its own name and has
+    no street number or postal code ("Cape Town, South Africa").
+    """
+    types = candidate.get('types')
+    if types:
+        return all(kind in LOCALITY_TYPES for kind in types)
+    name = candidate.get('name') or ''
+    address = candidate.get('formatted_address') or ''
+    return bool(name) and address.startswith(name) and not DIGIT_RE.search(address)
+
+
+def candidate_from_establishment(establishment: Dict[str, Any]) -> Dict[str, Any]:
+    """Find Place candidate for a whatstheplace document."""
+    return {
+        'place_id': establishment['id'],
+        'formatted_address': establishment.get('formattedAddress', ''),
+        'geometry': {'location': establishment.get('location')},
+        'name': establishment.get('displayName', ''),
+    }
+
+
+class VenueGazetteer:
+    """Known venues and a trigram index over every name they go by."""
+
+    def __init__(self, threshold: float = MATCH_THRESHOLD):
+        self.threshold = threshold
+        self.candidates: Dict[str, Dict[str, Any]] = {}
+        self._names: List[Tuple[str, frozenset, str]] = []  # (key, trigrams, place_id)
+        self._keys: Dict[str, int] = {}
+        self._index: Dict[str, List[int]] = defaultdict(list)
+        self._localities = set()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.candidates)
+
+    def add(self, name: str, candidate: Dict[str, Any]) -> None:
+        """Index ``name`` (and the candidate's own name) as spellings of its place."""
+        place_id = candidate.get('place_id')
+        if not place_id:
+            return
+        with self._lock:
+            self.candidates.setdefault(place_id, candidate)
+            if is_locality(self.candidates[place_id]):
+                self._localities.add(place_id)
+            for spelling in (name, candidate.get('name') or ''):
+                key = normalise_venue(spelling)
+                if not key or key in self._keys:
+                    continue
+                # Lookups run without the lock, so an entry is complete
+                # before the index points at it
+                grams = trigrams(key)
+                entry = len(self._names)
+                self._names.append((key, grams, place_id))
+                self._keys[key] = entry
+                for gram in grams:
+                    self._index[gram].append(entry)
+
+    def match(self, name: str) -> Optional[Tuple[Dict[str, Any], float]]:
+        """Best known (candidate, score) for a venue name, if confident enough."""
+        key = normalise_venue(name)
+        if not key:
+            return None
+        exact = self._keys.get(key)
+        if exact is not None:
+            return self.candidates[self._names[exact][2]], 1.0
+
+        query = trigrams(key)
+        shared: Dict[int, int] = defaultdict(int)
+        for gram in query:
+            for entry in self._index.get(gram, ()):
+                shared[entry] += 1
+
+        best, best_score = None, 0.0
+        for entry, count in shared.items():
+            _, grams, place_id = self._names[entry]
+            # A city or suburb is only ever found under its own name, so
+            # "<venue>, <city>" does not resolve to the city
+            if len(grams) < MIN_TRIGRAMS or place_id in self._localities:
+                continue
+            # The lesser of how much of the known name the query contains
+            # and how much of the query the known name explains
+            score = count / max(len(grams), len(query))
+            if score > best_score:
+                best, best_score = place_id, score
+        if best is None or best_score < self.threshold:
+            return None
+        return self.candidates[best], best_score
+
+    def lookup(self, name: str) -> Optional[Dict[str, Any]]:
+        """Find Place-shaped response for a confident match, else None."""
+        found = self.match(name)
+        if found is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return {'status': 'OK', 'candidates': [found[0]]}
+
+    def names(self) -> Iterable[Tuple[str, str]]:
+        """(normalised name, place_id) of every indexed spelling."""
+        return ((key, place_id) for key, _, place_id in self._names)
+
+    def save(self, path: str = DEFAULT_GAZETTEER_PATH) -> None:
+        """Write the venues and their spellings as JSON."""
+        spellings = defaultdict(list)
+        for key, place_id in self.names():
+            spellings[place_id].append(key)
+        data = [{'candidate': candidate, 'names': spellings[place_id]}
+                for place_id, candidate in self.candidates.items()]
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as tmp:
+                json.dump(data, tmp)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_GAZETTEER_PATH, threshold: float = MATCH_THRESHOLD) -> 'VenueGazetteer':
+        """Gazetteer saved by save(); empty if there is no file yet."""
+        gazetteer = cls(threshold)
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return gazetteer
+        for venue in data:
+            for name in venue['names']:
+                gazetteer.add(name, venue['candidate'])
+        return gazetteer
+
+
+_default_gazetteer: Optional[VenueGazetteer] = None
+_default_lock = threading.Lock()
+
+
+def get_gazetteer() -> VenueGazetteer:
+    """Return the process-wide gazetteer, loading it on first use."""
+    global _default_gazetteer
+    if _default_gazetteer is None:
+        with _default_lock:
+            if _default_gazetteer is None:
+                _default_gazetteer = VenueGazetteer.load()
+    return _default_gazetteer
+
+
+def configure_gazetteer(gazetteer: VenueGazetteer) -> VenueGazetteer:
+    """Replace the process-wide gazetteer."""
+    global _default_gazetteer
+    with _default_lock:
+        _default_gazetteer = gazetteer
+    return _default_gazetteer
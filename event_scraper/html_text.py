@@ -0,0 +1,105 @@
+"""
+Plain text of HTML fragments such as API-supplied event descriptions.
+
+html_to_text streams the markup through the stdlib html.parser tokenizer
+and keeps only the text nodes, without building a tree. The result matches
+BeautifulSoup(markup, "html.parser").get_text(separator="\\n") with
+non-breaking spaces turned into plain spaces and the ends stripped: each
+text node gets its own line, whitespace between tags collapses the same
+way, and script, style and template contents, comments and declarations
+are dropped. Entities are decoded as html.unescape does, so a malformed
+reference such as "&copy" without its semicolon is decoded too.
+"""
+
+from collections import Counter
+from html.parser import HTMLParser
+from typing import List, Optional
+
+# Elements whose contents are not page text (get_text skips them too).
+NON_TEXT_TAGS = frozenset({'script', 'style', 'template'})
+# Elements inside which whitespace-only text is kept as-is.
+PRESERVE_WHITESPACE_TAGS = frozenset({'pre', 'textarea'})
+ASCII_SPACES = frozenset('\x20\x0a\x09\x0c\x0d')
+# Elements that never have contents, so never stay open.
+VOID_TAGS = frozenset({
+    'area', 'base', 'basefont', 'bgsound', 'br', 'col', 'command', 'embed', 'frame', 'hr', 'image',
+    'img', 'input', 'isindex', 'keygen', 'link', 'menuitem', 'meta', 'nextid', 'param', 'source',
+    'spacer', 'track', 'wbr',
+})
+
+
+class _TextCollector(HTMLParser):
+    """Text nodes of a fragment, in document order."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.nodes: List[str] = []
+        self._pending: List[str] = []
+        # Open elements, and how many of each; an end tag closes everything
+        # opened since its start tag and is ignored if there is none
+        self._stack: List[str] = []
+        self._open: Counter = Counter()
+
+    def _inside(self, tags) -> bool:
+        return any(self._open[tag] for tag in tags)
+
+    def _flush(self) -> None:
+        if self._pending:
+            node = ''.join(self._pending)
+            self._pending = []
+            # Whitespace between tags collapses to one newline or space
+            if not self._inside(PRESERVE_WHITESPACE_TAGS) and ASCII_SPACES.issuperset(node):
+                node = "\n" if "\n" in node else " "
+            self.nodes.append(node)
+
+    def handle_starttag(self, tag, attrs):
+        self._flush()
+        if tag not in VOID_TAGS:
+            self._stack.append(tag)
+            self._open[tag] += 1
+
+    def handle_startendtag(self, tag, attrs):
+        self._flush()
+
+    def handle_endtag(self, tag):
+        self._flush()
+        if self._open[tag]:
+            while True:
+                closed = self._stack.pop()
+                self._open[closed] -= 1
+                if closed == tag:
+                    break
+
+    def handle_data(self, data):
+        if not self._inside(NON_TEXT_TAGS):
+            self._pending.append(data)
+
+    def handle_comment(self, data):
+        self._flush()
+
+    def handle_decl(self, decl):
+        self._flush()
+
+    def handle_pi(self, data):
+        self._flush()
+
+    def unknown_decl(self, data):
+        self._flush()
+        # get_text() keeps CDATA sections even inside a template; inside
+        # script and style the tokenizer never reports them
+        if data.startswith('CDATA['):
+            self.nodes.append(data[len('CDATA['):])
+
+    def close(self):
+        super().close()
+        self._flush()
+
+
+def html_to_text(markup: Optional[str], separator: str = "\n") -> str:
+    """Text of an HTML fragment, one text node per line."""
+    if not markup:
+        return ""
+    collector = _TextCollector()
+    collector.feed(markup)
+    collector.close()
+    return separator.join(collector.nodes).replace("\xa0", " ").strip()
@@ -0,0 +1,167 @@
+"""
+Persistent on-disk HTTP cache used by the transport layer.
+
+Responses are stored per URL as a gzip-compressed body plus a small JSON
+metadata file holding the validators (ETag / Last-Modified) and the time the
+entry was last confirmed fresh. Entries younger than the platform's TTL are
+served without touching the network; older ones are revalidated with a
+conditional GET. The metadata can also hold the EventDetails parsed from the
+stored body so an unchanged page skips the parse as well.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Optional, Dict, Any
+
+from .rate_limit import RequestGovernor
+from .urls import canonical_url
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CACHE_DIR = os.path.join(PROJECT_ROOT, '.http_cache')
+
+# Freshness TTL in seconds per platform key. Hosts without an entry (the
+# Places API, anything unknown) are not cached.
+CACHE_TTLS = {
+    'webtickets': 15 * 60,
+    'computicket': 15 * 60,
+    'howler': 15 * 60,
+    'ticketpro': 15 * 60,
+    'quicket': 15 * 60,
+}
+
+# Response headers worth keeping alongside the body.
+STORED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified')
+
+
+class CacheEntry:
+    """A cached response: body, validators and freshness stamp."""
+
+    def __init__(self, url: str, body: bytes, meta: Dict[str, Any]):
+        self.url = url
+        self.body = body
+        self.meta = meta
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return self.meta.get('headers', {})
+
+    @property
+    def encoding(self) -> Optional[str]:
+        return self.meta.get('encoding')
+
+    @property
+    def digest(self) -> str:
+        """Content hash of the body, used to key parsed results."""
+        return self.meta['digest']
+
+    def is_fresh(self, ttl: float) -> bool:
+        return time.time() - self.meta.get('validated_at', 0) < ttl
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for revalidation."""
+        headers = {}
+        if self.headers.get('ETag'):
+            headers['If-None-Match'] = self.headers['ETag']
+        if self.headers.get('Last-Modified'):
+            headers['If-Modified-Since'] = self.headers['Last-Modified']
+        return headers
+
+
+class HttpCache:
+    """Directory-backed response cache keyed by canonical request URL."""
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, ttls: Optional[Dict[str, float]] = None):
+        self.directory = directory
+        self.ttls = dict(CACHE_TTLS if ttls is None else ttls)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def ttl_for(self, url: str) -> Optional[float]:
+        """Freshness TTL for a URL, or None when the URL is not cacheable."""
+        return self.ttls.get(RequestGovernor.key_for_url(url))
+
+    def _paths(self, url: str):
+        key = hashlib.sha256(canonical_url(url).encode('utf-8')).hexdigest()
+        base = os.path.join(self.directory, key[:2], key)
+        return base + '.json', base + '.body.gz'
+
+    def _write(self, path: str, data: bytes) -> None:
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory)
+        try:
+            with os.fdopen(fd, 'wb') as tmp:
+                tmp.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _write_meta(self, url: str, meta: Dict[str, Any]) -> None:
+        meta_path, _ = self._paths(url)
+        self._write(meta_path, json.dumps(meta).encode('utf-8'))
+
+    def _load_meta(self, url: str) -> Optional[Dict[str, Any]]:
+        meta_path, _ = self._paths(url)
+        try:
+            with open(meta_path, 'rb') as f:
+                return json.loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def load(self, url: str) -> Optional[CacheEntry]:
+        """Return the cached entry for a URL, or None."""
+        meta = self._load_meta(url)
+        if meta is None:
+            return None
+        _, body_path = self._paths(url)
+        try:
+            with gzip.open(body_path, 'rb') as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        return CacheEntry(url, body, meta)
+
+    def store(self, url: str, body: bytes, headers: Dict[str, str], encoding: Optional[str]) -> CacheEntry:
+        """Store a 200 response body and its validators."""
+        meta = {
+            'headers': {name: headers[name] for name in STORED_HEADERS if name in headers},
+            'encoding': encoding,
+            'digest': hashlib.sha256(body).hexdigest(),
+            'validated_at': time.time(),
+        }
+        _, body_path = self._paths(url)
+        self._write(body_path, gzip.compress(body))
+        self._write_meta(url, meta)
+        return CacheEntry(url, body, meta)
+
+    def touch(self, entry: CacheEntry, headers: Dict[str, str]) -> CacheEntry:
+        """Mark an entry fresh again after a 304, picking up any new validators."""
+        for name in STORED_HEADERS:
+            if name in headers:
+                entry.meta.setdefault('headers', {})[name] = headers[name]
+        entry.meta['validated_at'] = time.time()
+        self._write_meta(entry.url, entry.meta)
+        return entry
+
+    def load_parsed(self, url: str, digest: str, scraper: str) -> Optional[str]:
+        """Parsed EventDetails JSON stored for this exact body, if any."""
+        meta = self._load_meta(url)
+        if meta is None:
+            return None
+        parsed = meta.get('parsed')
+        if parsed and parsed['digest'] == digest and parsed['scraper'] == scraper:
+            return parsed['details']
+        return None
+
+    def store_parsed(self, url: str, digest: str, scraper: str, details_json: str) -> None:
+        """Remember the EventDetails parsed from the body with this digest."""
+        meta = self._load_meta(url)
+        if meta is None or meta['digest'] != digest:
+            return
+        meta['parsed'] = {'digest': digest, 'scraper': scraper, 'details': details_json}
+        self._write_meta(url, meta)
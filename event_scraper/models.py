@@ -1,7 +1,26 @@
 from datetime import datetime
+from decimal import Decimal, ROUND_HALF_UP
 from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, HttpUrl, Field
 
+class Price(BaseModel):
+    """One ticket tier's price, as parsed by a scraper."""
+    amount: Decimal
+    currency: str = 'ZAR'
+    tier: str = 'General'
+    sold_out: bool = False
+
+    @property
+    def cents(self) -> int:
+        """Amount in cents."""
+        return int((self.amount * 100).to_integral_value(ROUND_HALF_UP))
+
+    def __str__(self) -> str:
+        amount = self.amount
+        if amount == amount.to_integral_value():
+            amount = amount.quantize(Decimal(1))
+        return f'R{amount}' if self.currency == 'ZAR' else f'{self.currency} {amount}'
+
 class EventDetails(BaseModel):
     """Model to store event details extracted from websites."""
     title: str
@@ -10,8 +29,27 @@ class EventDetails(BaseModel):
     location: str
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
-    prices: List[Dict[str, str]] = Field(default_factory=list)
+    prices: List[Price] = Field(default_factory=list)
     image_url: Optional[HttpUrl] = None
     event_url: HttpUrl
+    payment_url: Optional[HttpUrl] = None  # Where tickets are bought, if not event_url
     source: str  # 'webtickets' or 'computicket'
     raw_data: Dict[str, Any] = Field(default_factory=dict)  # Store raw data for debugging
+
+    @property
+    def available_prices(self) -> List[Price]:
+        """Tiers that are not sold out."""
+        return [price for price in self.prices if not price.sold_out]
+
+    @property
+    def min_price(self) -> Optional[Decimal]:
+        """Cheapest available tier, if any."""
+        amounts = [price.amount for price in self.available_prices]
+        return min(amounts) if amounts else None
+
+    @property
+    def max_price(self) -> Optional[Decimal]:
+        """Most expensive available tier, if any."""
+        amounts = [price.amount for price in self.available_prices]
+        return max(amounts) if amounts else None
+
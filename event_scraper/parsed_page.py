@@ -0,0 +1,79 @@
+"""
+Parsed event page shared by a scraper's _extract_* methods.
+
+Whole-document lookups (the page text, block texts, meta tags and images)
+are computed on first use and then reused, so each page costs one pass per
+lookup instead of one per extractor. Every lookup reads the same lxml tree,
+and the tree itself is only built once an extractor needs it, so a page
+whose structured data already covers every field is never parsed.
+"""
+
+from functools import cached_property
+from typing import Optional, Any, Dict, List, Tuple
+
+from .specs import PlatformSpec, build_tree, raw_text_of
+from .structured_data import extract_structured_data
+from .text_blocks import TextIndex
+
+
+class ParsedPage:
+    """Event page markup with a lazily built lxml tree and memoised lookups."""
+
+    def __init__(self, markup, url: Optional[str] = None):
+        self.markup = markup
+        self.url = url
+        self._selected: Dict[PlatformSpec, Tuple[Dict[str, Any], List[str]]] = {}
+
+    @cached_property
+    def tree(self):
+        """lxml.html document of the full markup."""
+        return build_tree(self.markup)
+
+    def select(self, spec: PlatformSpec) -> Tuple[Dict[str, Any], List[str]]:
+        """spec.evaluate() against the page's lxml tree, memoised per spec."""
+        if spec not in self._selected:
+            self._selected[spec] = spec.evaluate(self.tree)
+        return self._selected[spec]
+
+    @cached_property
+    def structured_data(self) -> Dict[str, Any]:
+        """Fields found in JSON-LD, app state or og:image, read without parsing the DOM."""
+        return extract_structured_data(self.markup)
+
+    @cached_property
+    def text(self) -> str:
+        """Full text of the document, as soup.get_text()."""
+        return raw_text_of(self.tree)
+
+    @cached_property
+    def text_blocks(self) -> TextIndex:
+        """Stripped text of every <div>, <p> and <span>, indexed in one pass."""
+        return TextIndex(self.tree, ('div', 'p', 'span'))
+
+    @cached_property
+    def paragraphs(self) -> List[str]:
+        """Stripped text of every <p>, in document order."""
+        return [self.text_blocks.text_of(span) for span in self.text_blocks.blocks('p')]
+
+    @cached_property
+    def meta_tags(self) -> Dict[Tuple[str, str], Any]:
+        """First <meta> element for each name= and property= value."""
+        tags = {}
+        for tag in self.tree.iter('meta'):
+            for attr in ('name', 'property'):
+                value = tag.get(attr)
+                if value:
+                    tags.setdefault((attr, value), tag)
+        return tags
+
+    def meta_content(self, name: Optional[str] = None, property: Optional[str] = None) -> Optional[str]:
+        """content= of the matching meta tag; '' if it has none, None if there is no such tag."""
+        tag = self.meta_tags.get(('name', name) if name else ('property', property))
+        if tag is None:
+            return None
+        return tag.get('content', '')
+
+    @cached_property
+    def images(self) -> List[Any]:
+        """Every <img> element, in document order."""
+        return list(self.tree.iter('img'))
@@ -0,0 +1,133 @@
+"""
+Persistent venue lookup cache in front of the Google Places API.
+
+The same few hundred venues recur across events, so Find Place responses
+are kept in a SQLite table keyed by the normalised venue name. Found places
+are reused for PLACE_TTL; venues Places has no match for are remembered for
+the shorter MISS_TTL so they are retried now and then. Errors, quota
+responses and anything else Places might answer differently next time are
+never stored.
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from typing import Optional, Any, Dict, List, Tuple
+
+from .http_cache import PROJECT_ROOT
+
+DEFAULT_PLACES_DB = os.path.join(PROJECT_ROOT, '.places_cache.sqlite')
+
+PLACE_TTL = 30 * 24 * 60 * 60
+MISS_TTL = 24 * 60 * 60
+
+# Find Place statuses that describe the venue rather than the request.
+CACHEABLE_STATUSES = frozenset({'OK', 'ZERO_RESULTS'})
+
+NON_WORD_RE = re.compile(r'[^\w]+')
+
+
+def normalise_venue(name: str) -> str:
+    """Case-, accent- and punctuation-insensitive key for a venue name."""
+    name = unicodedata.normalize('NFKD', name)
+    name = ''.join(char for char in name if not unicodedata.combining(char))
+    return NON_WORD_RE.sub(' ', name.casefold()).strip()
+
+
+def is_miss(place_info: Dict[str, Any]) -> bool:
+    """Whether a Find Place response has no candidates."""
+    return not place_info.get('candidates')
+
+
+class PlacesCache:
+    """SQLite-backed Find Place responses with TTLs and hit/miss counters."""
+
+    def __init__(self, path: str = DEFAULT_PLACES_DB, ttl: float = PLACE_TTL, miss_ttl: float = MISS_TTL):
+        self.path = path
+        self.ttl = ttl
+        self.miss_ttl = miss_ttl
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ':memory:':
+            self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS places ('
+            'key TEXT PRIMARY KEY, response TEXT NOT NULL, miss INTEGER NOT NULL, stored_at REAL NOT NULL)')
+
+    def lookup(self, name: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """(True, response) for a live entry, (False, None) otherwise."""
+        with self._lock:
+            row = self._db.execute(
+                'SELECT response, miss, stored_at FROM places WHERE key = ?', (normalise_venue(name),)).fetchone()
+            if row is not None:
+                response, miss, stored_at = row
+                if time.time() - stored_at < (self.miss_ttl if miss else self.ttl):
+                    if miss:
+                        self.negative_hits += 1
+                    else:
+                        self.hits += 1
+                    return True, json.loads(response)
+            self.misses += 1
+            return False, None
+
+    def store(self, name: str, place_info: Dict[str, Any]) -> bool:
+        """Remember a Find Place response; returns False if it is not cacheable."""
+        if place_info.get('status') not in CACHEABLE_STATUSES:
+            return False
+        with self._lock:
+            self._db.execute(
+                'INSERT OR REPLACE INTO places (key, response, miss, stored_at) VALUES (?, ?, ?, ?)',
+                (normalise_venue(name), json.dumps(place_info), int(is_miss(place_info)), time.time()))
+        return True
+
+    def found_places(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """(normalised name, response) of every stored lookup that found a place."""
+        with self._lock:
+            rows = self._db.execute('SELECT key, response FROM places WHERE miss = 0').fetchall()
+        return [(key, json.loads(response)) for key, response in rows]
+
+    def stats(self) -> Dict[str, int]:
+        """Lookup counters for this process and the number of stored venues."""
+        with self._lock:
+            entries = self._db.execute('SELECT COUNT(*) FROM places').fetchone()[0]
+            return {
+                'hits': self.hits,
+                'negative_hits': self.negative_hits,
+                'misses': self.misses,
+                'entries': entries,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+_default_cache: Optional[PlacesCache] = None
+_default_lock = threading.Lock()
+
+
+def get_places_cache() -> PlacesCache:
+    """Return the process-wide Places cache, creating it on first use."""
+    global _default_cache
+    if _default_cache is None:
+        with _default_lock:
+            if _default_cache is None:
+                _default_cache = PlacesCache()
+    return _default_cache
+
+
+def configure_places_cache(**kwargs: Any) -> PlacesCache:
+    """Replace the process-wide Places cache with one built from ``kwargs``."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is not None:
+            _default_cache.close()
+        _default_cache = PlacesCache(**kwargs)
+    return _default_cache
@@ -0,0 +1,40 @@
+"""
+Price text parsing shared by the scrapers.
+
+Each scraper turns the price text it finds into Price records once, with
+the patterns compiled here, so everything downstream reads Decimal amounts
+instead of parsing 'R550' strings back character by character.
+"""
+
+import re
+from decimal import Decimal, InvalidOperation
+from typing import Optional, Any, List
+
+# "1,200.50", "150", "99.5"
+AMOUNT_RE = re.compile(r'\d+(?:,\d{3})*(?:\.\d+)?')
+# "R150", "R1,200.00"
+RAND_RE = re.compile(r'R(\d+(?:,\d{3})*(?:\.\d{1,2})?)')
+# "ZAR 150.00"
+ZAR_RE = re.compile(r'ZAR\s+(\d+(?:,\d{3})*(?:\.\d{1,2})?)')
+
+
+def to_amount(value: Any) -> Optional[Decimal]:
+    """Decimal amount of a number or numeric string ('1,200.00'), else None."""
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        amount = Decimal(str(value).strip().replace(',', ''))
+    except InvalidOperation:
+        return None
+    return amount if amount.is_finite() and amount >= 0 else None
+
+
+def parse_amount(text: str) -> Optional[Decimal]:
+    """First amount in a price label such as 'R 1,200.00', else None."""
+    match = AMOUNT_RE.search(text)
+    return to_amount(match.group()) if match else None
+
+
+def rand_amounts(text: str) -> List[Decimal]:
+    """Every 'R<amount>' in the text, in order."""
+    return [to_amount(amount) for amount in RAND_RE.findall(text)]
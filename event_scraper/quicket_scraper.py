@@ -1,17 +1,22 @@
 import os
 import re
 import requests
-from bs4 import BeautifulSoup
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from dotenv import load_dotenv
 
 from .base_scraper import BaseScraper
-from .models import EventDetails
+from .dates import parse_iso
+from .html_text import html_to_text
+from .models import EventDetails, Price
+from .prices import to_amount
 
 class QuicketScraper(BaseScraper):
     """Scraper for quicket.co.za event pages."""
     
+    # Details come from the Quicket API, not the event page itself.
+    caches_parsed_pages = False
+    
     def extract_event_details(self, url: str) -> Optional[EventDetails]:
         """Extract event details from a Quicket event page."""
         load_dotenv()
@@ -40,7 +45,7 @@ class QuicketScraper(BaseScraper):
         
         try:
             # Make API request
-            response = requests.get(url=quicket_url, params=params, timeout=10)
+            response = self.transport.get(quicket_url, params=params)
             response.raise_for_status()
             response_json = response.json()
             
@@ -70,6 +75,7 @@ class QuicketScraper(BaseScraper):
                 prices=prices,
                 image_url=image_url,
                 event_url=url,
+                payment_url=response_json.get('url') or None,
                 source='quicket',
                 raw_data=response_json
             )
@@ -83,13 +89,7 @@ class QuicketScraper(BaseScraper):
     
     def _clean_description(self, description: str) -> str:
         """Clean HTML description to plain text."""
-        if not description:
-            return ""
-        
-        soup = BeautifulSoup(description, "html.parser")
-        cleaned_description = soup.get_text(separator="\n")
-        cleaned_text = cleaned_description.replace("\xa0", " ").strip()
-        return cleaned_text
+        return html_to_text(description)
     
     def _extract_venue_and_location(self, response_json: Dict[str, Any]) -> tuple[str, str]:
         """Extract venue and location information from API response."""
@@ -125,10 +125,10 @@ class QuicketScraper(BaseScraper):
             end_date = None
             
             if start_date_str:
-                start_date = datetime.strptime(start_date_str, "%Y-%m-%dT%H:%M:%S")
+                start_date = parse_iso(start_date_str)
             
             if end_date_str:
-                end_date = datetime.strptime(end_date_str, "%Y-%m-%dT%H:%M:%S")
+                end_date = parse_iso(end_date_str)
             
             return start_date, end_date
             
@@ -143,22 +143,18 @@ class QuicketScraper(BaseScraper):
             image_url = f"https:{image_url}"
         return image_url
     
-    def _extract_prices(self, response_json: Dict[str, Any]) -> List[Dict[str, str]]:
+    def _extract_prices(self, response_json: Dict[str, Any]) -> List[Price]:
         """Extract price information from API response."""
         prices = []
-        tickets = response_json.get("tickets", [])
         
-        # Filter out sold out tickets and get available prices
-        available_tickets = [ticket for ticket in tickets if not ticket.get('soldOut', True)]
-        
-        for ticket in available_tickets:
-            price = ticket.get('price')
-            ticket_type = ticket.get('name', 'General')
-            
-            if price is not None:
-                prices.append({
-                    'type': ticket_type,
-                    'price': str(price)
-                })
+        for ticket in response_json.get("tickets", []):
+            amount = to_amount(ticket.get('price'))
+            if amount is not None:
+                prices.append(Price(
+                    amount=amount,
+                    tier=ticket.get('name') or 'General',
+                    # Tickets without a soldOut flag are treated as sold out
+                    sold_out=bool(ticket.get('soldOut', True)),
+                ))
         
         return prices
@@ -0,0 +1,137 @@
+"""
+Per-platform request governor used by the HTTP transport.
+
+Each platform (the keys identify_platform returns, or the host name for
+anything else such as maps.googleapis.com) gets a token bucket that caps
+requests per second and a semaphore that caps concurrent connections.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, Iterator
+from urllib.parse import urlparse
+
+from .urls import platform_for_url
+
+
+class PlatformLimits:
+    """Request budget for one platform."""
+
+    def __init__(self, requests_per_second: Optional[float] = None, burst: int = 1,
+                 max_concurrent: Optional[int] = None):
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.max_concurrent = max_concurrent
+
+    def __repr__(self) -> str:
+        return (f"PlatformLimits(requests_per_second={self.requests_per_second}, "
+                f"burst={self.burst}, max_concurrent={self.max_concurrent})")
+
+
+# The scraped sites throttle aggressively, the APIs less so. Anything not
+# listed here falls back to DEFAULT_LIMITS.
+PLATFORM_LIMITS = {
+    'webtickets': PlatformLimits(requests_per_second=2, burst=4, max_concurrent=4),
+    'computicket': PlatformLimits(requests_per_second=2, burst=4, max_concurrent=4),
+    'howler': PlatformLimits(requests_per_second=2, burst=4, max_concurrent=4),
+    'ticketpro': PlatformLimits(requests_per_second=2, burst=4, max_concurrent=4),
+    'quicket': PlatformLimits(requests_per_second=5, burst=10, max_concurrent=8),
+}
+DEFAULT_LIMITS = PlatformLimits(requests_per_second=10, burst=10, max_concurrent=10)
+
+
+class TokenBucket:
+    """Thread-safe token bucket. Callers reserve a token and sleep until it is due."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, blocking until it is available. Returns seconds waited."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            delay = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if delay:
+            time.sleep(delay)
+        return delay
+
+
+class RequestGovernor:
+    """Caps request rate and concurrency per platform and records queue waits."""
+
+    def __init__(self, limits: Optional[Dict[str, PlatformLimits]] = None,
+                 default: PlatformLimits = DEFAULT_LIMITS):
+        self.limits = dict(PLATFORM_LIMITS if limits is None else limits)
+        self.default = default
+        self.buckets: Dict[str, Optional[TokenBucket]] = {}
+        self.semaphores: Dict[str, Optional[threading.BoundedSemaphore]] = {}
+        self.waits: Dict[str, Dict[str, float]] = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key_for_url(url: str) -> str:
+        """Platform key for a URL; unknown hosts are governed by host name."""
+        host = urlparse(url).netloc.lower()
+        platform = platform_for_url(host)
+        return host if platform == 'unknown' else platform
+
+    def _controls(self, key: str):
+        with self.lock:
+            if key not in self.buckets:
+                limits = self.limits.get(key, self.default)
+                self.buckets[key] = (TokenBucket(limits.requests_per_second, limits.burst)
+                                     if limits.requests_per_second else None)
+                self.semaphores[key] = (threading.BoundedSemaphore(limits.max_concurrent)
+                                        if limits.max_concurrent else None)
+                self.waits[key] = {'requests': 0, 'total_wait': 0.0, 'max_wait': 0.0}
+            return self.buckets[key], self.semaphores[key]
+
+    def _record(self, key: str, waited: float) -> None:
+        with self.lock:
+            stats = self.waits[key]
+            stats['requests'] += 1
+            stats['total_wait'] += waited
+            stats['max_wait'] = max(stats['max_wait'], waited)
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator[float]:
+        """
+        Hold a request slot for ``url`` for the duration of the block.
+        Yields the number of seconds the request waited in the queue.
+        """
+        key = self.key_for_url(url)
+        bucket, semaphore = self._controls(key)
+
+        queued_at = time.monotonic()
+        if semaphore is not None:
+            semaphore.acquire()
+        try:
+            if bucket is not None:
+                bucket.acquire()
+            waited = time.monotonic() - queued_at
+            self._record(key, waited)
+            yield waited
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Queue wait totals per platform, for tuning throughput against ban risk."""
+        with self.lock:
+            return {
+                key: {
+                    'requests': stats['requests'],
+                    'total_wait': round(stats['total_wait'], 3),
+                    'avg_wait': round(stats['total_wait'] / stats['requests'], 3) if stats['requests'] else 0.0,
+                    'max_wait': round(stats['max_wait'], 3),
+                }
+                for key, stats in self.waits.items()
+            }
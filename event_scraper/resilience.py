@@ -0,0 +1,146 @@
+"""
+Retry and circuit-breaker policies used by the HTTP transport.
+
+Transient failures (connection resets, timeouts, 429 and 5xx responses) are
+retried with jittered exponential backoff. Every attempt is also reported to a
+per-platform circuit breaker; once a platform's recent error rate crosses the
+threshold the breaker opens and further requests fail fast with
+CircuitOpenError until a cool-down has passed and a probe request succeeds.
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from typing import Optional, Dict, Any
+
+import requests
+
+# Exceptions worth another attempt. ConnectionError covers resets and
+# connect timeouts.
+TRANSIENT_EXCEPTIONS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised instead of sending a request to a platform whose breaker is open."""
+
+
+class RetryPolicy:
+    """How many times to retry a transient failure and how long to back off."""
+
+    def __init__(self, max_retries: int = 3, backoff_base: float = 0.5, backoff_cap: float = 8.0):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+
+    def delay(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """Seconds to sleep before retry number ``attempt + 1`` (full jitter)."""
+        if response is not None and response.status_code == 429:
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                return min(float(retry_after), self.backoff_cap)
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """Closed / open / half-open breaker driven by the error rate of recent requests."""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: float = 0.5, min_requests: int = 5,
+                 window: int = 20, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.min_requests = min_requests
+        self.reset_timeout = reset_timeout
+        self.outcomes = deque(maxlen=window)
+        self.state = self.CLOSED
+        self.opened_at = 0.0
+        self.times_opened = 0
+        self.rejected = 0
+        self.probe_in_flight = False
+        self.lock = threading.Lock()
+
+    def before_request(self) -> None:
+        """Raise CircuitOpenError unless a request may be sent now."""
+        with self.lock:
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self.probe_in_flight = False
+            if self.state == self.CLOSED:
+                return
+            if self.state == self.HALF_OPEN and not self.probe_in_flight:
+                self.probe_in_flight = True
+                return
+            self.rejected += 1
+            raise CircuitOpenError("Circuit open, failing fast")
+
+    def _open(self) -> None:
+        self.state = self.OPEN
+        self.opened_at = time.monotonic()
+        self.times_opened += 1
+        self.probe_in_flight = False
+
+    def record_success(self) -> None:
+        with self.lock:
+            self.outcomes.append(True)
+            if self.state == self.HALF_OPEN:
+                self.state = self.CLOSED
+                self.outcomes.clear()
+                self.probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self.lock:
+            self.outcomes.append(False)
+            if self.state == self.HALF_OPEN:
+                self._open()
+                return
+            failures = self.outcomes.count(False)
+            if (self.state == self.CLOSED and len(self.outcomes) >= self.min_requests
+                    and failures / len(self.outcomes) >= self.failure_threshold):
+                self._open()
+
+    def cancel_probe(self) -> None:
+        """Release the half-open probe slot after a request that proved nothing."""
+        with self.lock:
+            self.probe_in_flight = False
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == self.OPEN
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                'state': self.state,
+                'recent_failures': self.outcomes.count(False),
+                'recent_requests': len(self.outcomes),
+                'times_opened': self.times_opened,
+                'rejected': self.rejected,
+            }
+
+
+class CircuitBreakers:
+    """One CircuitBreaker per platform key, created on first use."""
+
+    def __init__(self, **breaker_options: Any):
+        self.breaker_options = breaker_options
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self.lock = threading.Lock()
+
+    def get(self, key: str) -> CircuitBreaker:
+        with self.lock:
+            if key not in self.breakers:
+                self.breakers[key] = CircuitBreaker(**self.breaker_options)
+            return self.breakers[key]
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self.lock:
+            breakers = dict(self.breakers)
+        return {key: breaker.snapshot() for key, breaker in breakers.items()}
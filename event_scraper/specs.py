@@ -0,0 +1,217 @@
+"""
+Declarative per-platform extraction specs.
+
+A PlatformSpec names the anchor sections of a platform's event page and, per
+field, an ordered list of XPath selectors plus a post-processor. All XPaths
+are compiled once at import and evaluated against an lxml tree, so a layout
+change means editing the selectors below rather than a chain of soup.find()
+calls. The scrapers keep their text and regex heuristics in Python and read
+the selector-driven fields through ParsedPage.select().
+"""
+
+from typing import Optional, Any, Callable, Dict, List, Tuple, Union
+
+import lxml.html
+from lxml import etree
+
+# Text of these elements is not page text (BeautifulSoup's get_text skips it too).
+NON_TEXT_TAGS = frozenset({'script', 'style', 'template'})
+# Inside these, whitespace-only strings are kept as they are; elsewhere
+# BeautifulSoup collapses each to a single newline or space.
+PRESERVE_WHITESPACE_TAGS = frozenset({'pre', 'textarea'})
+ASCII_SPACES = frozenset('\x20\x0a\x09\x0c\x0d')
+
+
+def has_class(name: str) -> str:
+    """
+    XPath predicate matching BeautifulSoup's class_= semantics: a single class
+    matches any element carrying it, a class string with spaces must equal
+    the element's whole class attribute.
+    """
+    if ' ' in name:
+        return f"normalize-space(@class)='{name}'"
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _collapse(string: str) -> str:
+    if ASCII_SPACES.issuperset(string):
+        return "\n" if "\n" in string else " "
+    return string
+
+
+def _strings(node, collapse: bool = False) -> List[str]:
+    if collapse and node.tag in PRESERVE_WHITESPACE_TAGS:
+        collapse = False
+    strings = [_collapse(node.text) if collapse else node.text] if node.text else []
+    for child in node:
+        if isinstance(child.tag, str) and child.tag not in NON_TEXT_TAGS:
+            strings.extend(_strings(child, collapse))
+        if child.tail:
+            strings.append(_collapse(child.tail) if collapse else child.tail)
+    return strings
+
+
+def _ancestor_tags(node) -> frozenset:
+    return frozenset(parent.tag for parent in node.iterancestors())
+
+
+def text_of(node) -> str:
+    """Stripped text of a node, as Tag.get_text(strip=True)."""
+    if isinstance(node, str):
+        return node.strip()
+    if _ancestor_tags(node) & NON_TEXT_TAGS:
+        return ''
+    return ''.join(s.strip() for s in _strings(node))
+
+
+def raw_text_of(node) -> str:
+    """Unstripped text of a node, as Tag.get_text()."""
+    if isinstance(node, str):
+        return str(node)
+    ancestors = _ancestor_tags(node)
+    if ancestors & NON_TEXT_TAGS:
+        return ''
+    return ''.join(_strings(node, collapse=not ancestors & PRESERVE_WHITESPACE_TAGS))
+
+
+def value_of(node) -> str:
+    """Attribute value as-is, or the stripped text of an element."""
+    return str(node) if isinstance(node, str) else text_of(node)
+
+
+def build_tree(markup: Union[str, bytes]):
+    """Parse markup into an lxml.html document."""
+    if isinstance(markup, str):
+        parser = lxml.html.HTMLParser(encoding='utf-8')
+        return lxml.html.document_fromstring(markup.encode('utf-8'), parser=parser)
+    return lxml.html.document_fromstring(markup)
+
+
+class FieldSpec:
+    """
+    Ordered XPath selectors for one field, evaluated relative to an anchor
+    (or the document). The first selector that matches wins; an attribute
+    selector only matches a non-empty value. ``many`` keeps every node the
+    winning selector returned instead of the first.
+    """
+
+    def __init__(self, *selectors: str, anchor: Optional[str] = None,
+                 post: Callable[[Any], Any] = value_of, many: bool = False):
+        self.selectors = [etree.XPath(selector) for selector in selectors]
+        self.anchor = anchor
+        self.post = post
+        self.many = many
+
+    def evaluate(self, context) -> Any:
+        for selector in self.selectors:
+            found = [node for node in selector(context) if not isinstance(node, str) or node]
+            if found:
+                return [self.post(node) for node in found] if self.many else self.post(found[0])
+        return [] if self.many else None
+
+
+class PlatformSpec:
+    """
+    Anchors and fields for one platform. Anchors are (parent, xpath) pairs
+    resolved once per page in declaration order; fields whose anchor is
+    missing come back empty without being evaluated.
+    """
+
+    def __init__(self, fields: Dict[str, FieldSpec],
+                 anchors: Optional[Dict[str, Tuple[Optional[str], str]]] = None):
+        self.anchors = {name: (parent, etree.XPath(xpath)) for name, (parent, xpath) in (anchors or {}).items()}
+        self.fields = fields
+
+    def evaluate(self, tree) -> Tuple[Dict[str, Any], List[str]]:
+        """Field values and the names of any anchors that were not found."""
+        nodes = {}
+        for name, (parent, xpath) in self.anchors.items():
+            context = tree if parent is None else nodes.get(parent)
+            if context is None:
+                continue
+            found = xpath(context)
+            if found:
+                nodes[name] = found[0]
+
+        values = {}
+        for name, field in self.fields.items():
+            if field.anchor is None:
+                values[name] = field.evaluate(tree)
+            elif field.anchor in nodes:
+                values[name] = field.evaluate(nodes[field.anchor])
+            else:
+                values[name] = [] if field.many else None
+        missing = [name for name in self.anchors if name not in nodes]
+        return values, missing
+
+
+def _first_div(class_name: str, root: bool = False) -> str:
+    return f"({'//' if root else './/'}div[{has_class(class_name)}])[1]"
+
+
+HOWLER_SPEC = PlatformSpec(
+    anchors={
+        'page_wrapper': (None, _first_div('page-wrapper', root=True)),
+        'hero': ('page_wrapper', _first_div('event-hero')),
+        'hero_inset': ('hero', _first_div('inset-x--large-on-medium')),
+        'hero_content': ('hero_inset', _first_div('event-hero__content')),
+        'carousel': ('page_wrapper', _first_div('event-carousel')),
+        'carousel_content': ('carousel', _first_div('event-section__content')),
+        'bar': ('page_wrapper', _first_div('event-bar')),
+        'bar_info': ('bar', _first_div('event-bar__info')),
+        'bar_venue': ('bar_info', _first_div('event-detail event-detail__venue flex flex--align-items--center')),
+        'bar_date': ('bar_info', _first_div('event-detail event-detail__date flex flex--align-items--center')),
+        'bar_action': ('bar', _first_div('event-bar__action')),
+    },
+    fields={
+        'title': FieldSpec(f".//h1[{has_class('t-display')}]", anchor='hero_content'),
+        'description': FieldSpec('.//p', anchor='carousel_content', many=True),
+        'venue': FieldSpec('.//h3', anchor='bar_venue'),
+        'location': FieldSpec('.//a', anchor='bar_venue'),
+        'date_text': FieldSpec('.//a', anchor='bar_date'),
+        'date_alt': FieldSpec('.//h3', anchor='bar_date'),
+        'image_url': FieldSpec('(.//img)[1]/@src', anchor='hero_content'),
+        'purchase_path': FieldSpec('(.//a)[1]/@href', anchor='bar_action'),
+    },
+)
+
+# The ticket page link, which Howler still needs from the layout when the
+# structured data has every other field.
+HOWLER_PURCHASE_SPEC = PlatformSpec(
+    anchors={
+        'page_wrapper': (None, _first_div('page-wrapper', root=True)),
+        'bar': ('page_wrapper', _first_div('event-bar')),
+        'bar_action': ('bar', _first_div('event-bar__action')),
+    },
+    fields={'purchase_path': HOWLER_SPEC.fields['purchase_path']},
+)
+
+WEBTICKETS_SPEC = PlatformSpec(fields={
+    'title': FieldSpec("//h1[@id='PageHeaderPanel_pageHeader']", '//title/@title', '//title'),
+    'description': FieldSpec(f"//div[{has_class('event-description')}]"),
+    'venue': FieldSpec(f"//div[{has_class('row')}][contains(., 'Venue')]//div[{has_class('col-lg-8')}]"),
+    'panel_titles': FieldSpec(f"//div[{has_class('ticket-panel')}]/descendant::div[{has_class('ticket-panel-title')}][1]",
+                              many=True),
+    'panel_texts': FieldSpec(f"//div[{has_class('ticket-panel')}]", post=raw_text_of, many=True),
+    'card_prices': FieldSpec(f"//div[{has_class('product-card-price')}]", many=True),
+})
+
+COMPUTICKET_SPEC = PlatformSpec(fields={
+    'title': FieldSpec(f"//h1[{has_class('mt-4')}]"),
+})
+
+TICKETPRO_SPEC = PlatformSpec(fields={
+    'h1': FieldSpec('//h1'),
+    'title_tag': FieldSpec('//title', post=raw_text_of),
+    # Description candidates, tried in this order
+    'description_div': FieldSpec(f"//div[{has_class('description')}]"),
+    'description_p': FieldSpec(f"//p[{has_class('description')}]"),
+    'description_testid': FieldSpec("//div[@data-testid='event-description']"),
+})
+
+PLATFORM_SPECS = {
+    'howler': HOWLER_SPEC,
+    'webtickets': WEBTICKETS_SPEC,
+    'computicket': COMPUTICKET_SPEC,
+    'ticketpro': TICKETPRO_SPEC,
+}
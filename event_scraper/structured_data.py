@@ -0,0 +1,258 @@
+"""
+Structured-data fast path for event pages.
+
+Most ticketing pages describe the event in machine-readable form as well as
+in their layout: schema.org Event objects in ``application/ld+json`` scripts,
+the OpenGraph ``og:image`` tag, and framework state such as Next.js'
+``__NEXT_DATA__``. extract_structured_data pulls these out of the raw markup
+with a regex scan and json.loads, without building a DOM, and maps them onto
+the fields the scrapers' _extract_* methods produce. A scraper only falls
+back to its heuristics for the fields that come back missing.
+"""
+
+import html
+import json
+import re
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Tuple, Union
+
+from .dates import parse_iso
+from .html_text import html_to_text
+from .models import Price
+from .prices import to_amount
+
+LD_JSON_RE = re.compile(
+    r'<script\b[^>]*\btype\s*=\s*["\']application/ld\+json["\'][^>]*>(.*?)</script\s*>',
+    re.IGNORECASE | re.DOTALL)
+APP_STATE_RE = re.compile(
+    r'<script\b[^>]*\btype\s*=\s*["\']application/json["\'][^>]*>(.*?)</script\s*>',
+    re.IGNORECASE | re.DOTALL)
+META_RE = re.compile(r'<meta\b[^>]*>', re.IGNORECASE)
+ATTR_RE = re.compile(r'([\w:.-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+TAG_RE = re.compile(r'</?[a-zA-Z][^>]*>')
+
+# Keys a schema.org Event uses for each field.
+LD_KEYS = {
+    'title': ('name',),
+    'description': ('description',),
+    'start_date': ('startDate',),
+    'end_date': ('endDate',),
+    'image': ('image',),
+    'location': ('location',),
+    'offers': ('offers',),
+}
+
+# Keys an embedded app-state object may use for each field.
+STATE_KEYS = {
+    'title': ('name', 'title'),
+    'description': ('description',),
+    'start_date': ('startDate', 'start_date', 'startsAt', 'startDateTime', 'start'),
+    'end_date': ('endDate', 'end_date', 'endsAt', 'endDateTime', 'end'),
+    'image': ('image', 'imageUrl', 'image_url'),
+    'location': ('location', 'venue'),
+    'offers': ('offers', 'tickets'),
+}
+
+# Keys extract_structured_data can return.
+STRUCTURED_FIELDS = ('title', 'description', 'venue_and_location', 'dates', 'image_url', 'prices')
+
+# Upper bound on nodes visited when searching app state for an event.
+MAX_STATE_NODES = 20000
+
+
+def _load_json(text: str) -> Any:
+    try:
+        return json.loads(text)
+    except ValueError:
+        return None
+
+
+def _is_event_type(value: Any) -> bool:
+    types = value if isinstance(value, list) else [value]
+    return any(isinstance(t, str) and t.endswith('Event') for t in types)
+
+
+def _ld_events(data: Any) -> List[Dict[str, Any]]:
+    """schema.org Event objects in a JSON-LD document, including @graph."""
+    if isinstance(data, list):
+        return [event for item in data for event in _ld_events(item)]
+    if not isinstance(data, dict):
+        return []
+    if _is_event_type(data.get('@type')):
+        return [data]
+    return _ld_events(data.get('@graph', []))
+
+
+def _state_event(data: Any) -> Optional[Dict[str, Any]]:
+    """First object in an app-state blob that looks like an event."""
+    stack = [data]
+    visited = 0
+    while stack and visited < MAX_STATE_NODES:
+        node = stack.pop()
+        visited += 1
+        if isinstance(node, dict):
+            if _is_event_type(node.get('@type')):
+                return node
+            if (any(isinstance(node.get(key), str) for key in STATE_KEYS['title'])
+                    and any(node.get(key) for key in STATE_KEYS['start_date'])):
+                return node
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+    return None
+
+
+def _first(obj: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    for key in keys:
+        value = obj.get(key)
+        if value not in (None, '', [], {}):
+            return value
+    return None
+
+
+def _text(value: Any) -> Optional[str]:
+    if isinstance(value, str):
+        value = html.unescape(value).strip()
+        return value or None
+    return None
+
+
+def _description(value: Any) -> Optional[str]:
+    """Descriptions are often HTML, sometimes entity-escaped; keep the text."""
+    if not isinstance(value, str):
+        return None
+    if not TAG_RE.search(value):
+        value = html.unescape(value)
+        if not TAG_RE.search(value):
+            return value.strip() or None
+    return html_to_text(value) or None
+
+
+def _parse_datetime(value: Any) -> Optional[datetime]:
+    return parse_iso(value) if isinstance(value, str) else None
+
+
+def _image_url(value: Any) -> Optional[str]:
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if isinstance(value, dict):
+        value = value.get('url') or value.get('contentUrl')
+    url = _text(value)
+    return url if url and url.startswith(('http://', 'https://')) else None
+
+
+def _address_text(address: Any) -> Optional[str]:
+    if isinstance(address, dict):
+        parts = [address.get(key) for key in ('streetAddress', 'addressLocality', 'addressRegion')]
+        return ', '.join(part.strip() for part in parts if isinstance(part, str) and part.strip()) or None
+    return _text(address)
+
+
+def _venue_and_location(value: Any) -> Optional[Tuple[str, str]]:
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if isinstance(value, str):
+        venue = _text(value)
+        return (venue, venue) if venue else None
+    if not isinstance(value, dict):
+        return None
+    venue = _text(value.get('name'))
+    location = _address_text(value.get('address'))
+    if not venue:
+        return None
+    return venue, location or venue
+
+
+def _prices(value: Any) -> List[Price]:
+    offers = value if isinstance(value, list) else [value]
+    prices = []
+    for offer in offers:
+        if not isinstance(offer, dict):
+            continue
+        if isinstance(offer.get('offers'), (list, dict)):
+            prices.extend(_prices(offer['offers']))
+            continue
+        amount = to_amount(_first(offer, ('price', 'lowPrice')))
+        if amount is None:
+            continue
+        availability = offer.get('availability')
+        prices.append(Price(
+            amount=amount,
+            currency=_text(offer.get('priceCurrency')) or 'ZAR',
+            tier=_text(offer.get('name')) or 'General',
+            sold_out=isinstance(availability, str) and availability.endswith('SoldOut'),
+        ))
+    return prices
+
+
+def _event_fields(event: Dict[str, Any], keys: Dict[str, Tuple[str, ...]]) -> Dict[str, Any]:
+    fields: Dict[str, Any] = {}
+    title = _text(_first(event, keys['title']))
+    if title:
+        fields['title'] = title
+    description = _description(_first(event, keys['description']))
+    if description:
+        fields['description'] = description
+    start_date = _parse_datetime(_first(event, keys['start_date']))
+    if start_date:
+        fields['dates'] = (start_date, _parse_datetime(_first(event, keys['end_date'])))
+    image_url = _image_url(_first(event, keys['image']))
+    if image_url:
+        fields['image_url'] = image_url
+    venue_and_location = _venue_and_location(_first(event, keys['location']))
+    if venue_and_location:
+        fields['venue_and_location'] = venue_and_location
+    prices = _prices(_first(event, keys['offers']))
+    # Leave prices to the scraper's own lookup when every tier is sold out
+    if any(not price.sold_out for price in prices):
+        fields['prices'] = prices
+    return fields
+
+
+def _og_properties(markup: str) -> Dict[str, str]:
+    """content= of every og:* meta tag, first one wins."""
+    properties: Dict[str, str] = {}
+    for tag in META_RE.findall(markup):
+        if 'og:' not in tag:
+            continue
+        attrs = {name.lower(): a if a else b for name, a, b in ATTR_RE.findall(tag)}
+        prop = attrs.get('property') or attrs.get('name')
+        if prop and prop.startswith('og:') and attrs.get('content'):
+            properties.setdefault(prop, html.unescape(attrs['content']).strip())
+    return properties
+
+
+def extract_structured_data(markup: Union[str, bytes]) -> Dict[str, Any]:
+    """
+    Event fields found in the page's structured data. Keys are named after
+    the _extract_* methods they replace: 'title', 'description',
+    'venue_and_location' (venue, location), 'dates' (start, end),
+    'image_url' and 'prices'. Fields that are not present are left out.
+    JSON-LD wins over app state, which wins over the og:image tag.
+    """
+    if isinstance(markup, bytes):
+        markup = markup.decode('utf-8', errors='replace')
+
+    sources = []
+    for block in LD_JSON_RE.findall(markup):
+        events = _ld_events(_load_json(block))
+        if events:
+            sources.append(_event_fields(events[0], LD_KEYS))
+            break
+    for block in APP_STATE_RE.findall(markup):
+        event = _state_event(_load_json(block))
+        if event is not None:
+            sources.append(_event_fields(event, STATE_KEYS))
+            break
+
+    # og:title and og:description carry site branding and teaser cuts, so
+    # only the image is taken from OpenGraph.
+    og_image = _image_url(_og_properties(markup).get('og:image'))
+    if og_image:
+        sources.append({'image_url': og_image})
+
+    fields: Dict[str, Any] = {}
+    for source in sources:
+        for key, value in source.items():
+            fields.setdefault(key, value)
+    return fields
@@ -0,0 +1,113 @@
+"""
+Linear-time text index over a page's lxml tree, for picking description blocks.
+
+Calling get_text(strip=True) on every <div> re-serialises nested text once
+per enclosing div, which is quadratic in page depth. TextIndex walks the
+tree once, appends every stripped string to one document-wide string and
+records the [start, end) span each block element covers in it. A block's
+text, length, first character and keyword hits are then read from that
+string (keywords through a sorted list of match offsets), without touching
+the tree again.
+"""
+
+import re
+from bisect import bisect_left
+from typing import Optional, Dict, Iterable, Iterator, List, Tuple
+
+from lxml import etree
+
+from .specs import NON_TEXT_TAGS
+
+
+class TextIndex:
+    """Stripped text of every ``names`` element under ``root``, from one pass."""
+
+    def __init__(self, root, names: Iterable[str] = ('div', 'p')):
+        self.names = frozenset(names)
+        self.spans: Dict[str, List[Tuple[int, int]]] = {name: [] for name in self.names}
+        # (element name, index into its span list), in document order
+        self.order: List[Tuple[str, int]] = []
+        self._occurrences: Dict[str, List[int]] = {}
+        self._build(root)
+
+    def _build(self, root) -> None:
+        pieces = []
+        offset = 0
+        # Text inside script, style and template is not page text, but
+        # blocks in there still get an (empty) span, as get_text() gives them
+        skipping = 0
+        open_blocks: List[Tuple[str, int]] = []
+
+        def add(string: Optional[str]) -> None:
+            nonlocal offset
+            if string and not skipping:
+                stripped = string.strip()
+                if stripped:
+                    pieces.append(stripped)
+                    offset += len(stripped)
+
+        for event, element in etree.iterwalk(root, events=('start', 'end', 'comment', 'pi')):
+            tag = element.tag
+            if not isinstance(tag, str):
+                # Comments and processing instructions: only their tail is text
+                add(element.tail)
+                continue
+            if event == 'start':
+                if tag in self.names:
+                    self.spans[tag].append((offset, offset))
+                    self.order.append((tag, len(self.spans[tag]) - 1))
+                    open_blocks.append((tag, len(self.spans[tag]) - 1))
+                if tag in NON_TEXT_TAGS:
+                    skipping += 1
+                add(element.text)
+            else:
+                if tag in NON_TEXT_TAGS:
+                    skipping -= 1
+                if tag in self.names:
+                    name, index = open_blocks.pop()
+                    self.spans[name][index] = (self.spans[name][index][0], offset)
+                if element is not root:
+                    add(element.tail)
+        self.text = ''.join(pieces)
+        self.lower = self.text.lower()
+
+    def blocks(self, *names: str) -> Iterator[Tuple[int, int]]:
+        """Spans of every element named one of ``names``, in document order."""
+        if len(names) == 1:
+            return iter(self.spans[names[0]])
+        return (self.spans[name][index] for name, index in self.order if name in names)
+
+    def text_of(self, span: Tuple[int, int]) -> str:
+        """The block's text, as get_text(strip=True)."""
+        return self.text[span[0]:span[1]]
+
+    def contains(self, span: Tuple[int, int], keyword: str) -> bool:
+        """Whether the lower-cased block text contains ``keyword``."""
+        start, end = span
+        if len(self.lower) != len(self.text):
+            # Lower-casing changed some lengths, so offsets do not line up.
+            return keyword in self.text[start:end].lower()
+        occurrences = self._occurrences.get(keyword)
+        if occurrences is None:
+            occurrences = [m.start() for m in re.finditer(f'(?={re.escape(keyword)})', self.lower)]
+            self._occurrences[keyword] = occurrences
+        i = bisect_left(occurrences, start)
+        return i < len(occurrences) and occurrences[i] + len(keyword) <= end
+
+    def find_block(self, name: str, longer_than: int = 0, exclude: Iterable[str] = (),
+                   exclude_prefix: Optional[str] = None) -> Optional[str]:
+        """
+        Text of the first ``name`` block longer than ``longer_than`` characters
+        whose lower-cased text contains none of ``exclude`` and which does not
+        start with ``exclude_prefix``.
+        """
+        for span in self.spans[name]:
+            start, end = span
+            if end - start <= longer_than:
+                continue
+            if exclude_prefix and self.text.startswith(exclude_prefix, start, end):
+                continue
+            if any(self.contains(span, keyword) for keyword in exclude):
+                continue
+            return self.text_of(span)
+        return None
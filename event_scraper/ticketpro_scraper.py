@@ -3,21 +3,31 @@ Ticketpro scraper implementation.
 """
 
 import re
-import requests
-from datetime import datetime
-from typing import Optional, Dict, List, Tuple
+from datetime import datetime, timedelta
+from typing import Optional, List
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
-
+from . import dates
 from .base_scraper import BaseScraper, EventDetails
+from .models import Price
+from .parsed_page import ParsedPage
+from .prices import RAND_RE, ZAR_RE, to_amount
+from .specs import TICKETPRO_SPEC
+
+START_PRICE_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'Tickets? start at\s+(?:ZAR\s+)?R?(\d+(?:\.\d{2})?)',
+    r'from\s+(?:ZAR\s+)?R?(\d+(?:\.\d{2})?)',
+    r'Starting from\s+(?:ZAR\s+)?R?(\d+(?:\.\d{2})?)',
+)]
 
 
 class TicketproScraper(BaseScraper):
     """Ticketpro-specific scraper implementation."""
     
-    def __init__(self):
-        super().__init__()
+    spec = TICKETPRO_SPEC
+    
+    # The site is slow to render event pages.
+    fetch_timeout = 30
     
     def can_handle(self, url: str) -> bool:
         """Check if this scraper can handle the given URL."""
@@ -26,17 +36,18 @@ class TicketproScraper(BaseScraper):
     def extract_event_details(self, url: str) -> Optional[EventDetails]:
         """Extract event details from a Ticketpro URL."""
         try:
-            response = requests.get(url, headers=self.headers, timeout=30)
+            response = self.transport.get(url, timeout=self.fetch_timeout)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            page = self.parse_page(response.content, url)
             
-            # Extract all event information
-            title = self._extract_title(soup)
-            description = self._extract_description(soup)
-            venue, location = self._extract_venue_and_location(soup)
-            start_date, end_date = self._extract_dates(soup)
-            image_url = self._extract_image_url(soup, url)
-            prices = self._extract_prices(soup)
+            # Structured data first; the DOM heuristics only run for what it lacks
+            data = page.structured_data
+            title = data.get('title') or self._extract_title(page)
+            description = data.get('description') or self._extract_description(page)
+            venue, location = data.get('venue_and_location') or self._extract_venue_and_location(page)
+            start_date, end_date = data.get('dates') or self._extract_dates(page)
+            image_url = data.get('image_url') or self._extract_image_url(page, url)
+            prices = data.get('prices') or self._extract_prices(page)
             
             # Create and return the event details
             return EventDetails(
@@ -60,63 +71,49 @@ class TicketproScraper(BaseScraper):
             print(f"Error extracting Ticketpro event details: {e}")
             return None
     
-    def _extract_title(self, soup: BeautifulSoup) -> str:
+    def _extract_title(self, page: ParsedPage) -> str:
         """Extract the event title."""
+        fields = page.select(self.spec)[0]
         # Look for h1 first
-        title_elem = soup.find('h1')
-        if title_elem:
-            title = title_elem.get_text(strip=True)
+        title = fields['h1']
+        if title is not None:
             # Clean up title if it contains "Tickets for"
             if title.startswith('Tickets for '):
                 title = title.replace('Tickets for ', '').replace(' | Ticketpro', '')
             return title
         
         # Fallback to title tag
-        title_elem = soup.find('title')
-        if title_elem:
-            title = title_elem.get_text()
+        title = fields['title_tag']
+        if title is not None:
             if title.startswith('Tickets for '):
                 title = title.replace('Tickets for ', '').replace(' | Ticketpro', '')
             return title
         
         return "No title found"
     
-    def _extract_description(self, soup: BeautifulSoup) -> str:
+    def _extract_description(self, page: ParsedPage) -> str:
         """Extract the event description."""
         # First try meta description - often the best for Ticketpro
-        meta_desc = soup.find('meta', {'name': 'description'})
-        if meta_desc:
-            desc = meta_desc.get('content', '')
+        desc = page.meta_content(name='description')
+        if desc is not None:
             # Clean up the description
             desc = desc.replace('Buy tickets for', '').replace('from Ticketpro', '')
             if len(desc) > 100:
                 return self._clean_description(desc)
         
         # Look for description in various elements
-        description_patterns = [
-            soup.find('div', class_='description'),
-            soup.find('p', class_='description'),
-            soup.find('div', {'data-testid': 'event-description'})
-        ]
-        
-        for pattern in description_patterns:
-            if pattern:
-                desc = pattern.get_text(strip=True)
-                if desc and len(desc) > 50:  # Ensure it's a substantial description
-                    return self._clean_description(desc)
+        fields = page.select(self.spec)[0]
+        for field in ('description_div', 'description_p', 'description_testid'):
+            desc = fields[field]
+            if desc and len(desc) > 50:  # Ensure it's a substantial description
+                return self._clean_description(desc)
         
         # Look for paragraphs that might contain description
-        paragraphs = soup.find_all('p')
-        for p in paragraphs:
-            text = p.get_text(strip=True)
-            if (len(text) > 100 and 
-                'ticket' not in text.lower() and 
-                'price' not in text.lower() and
-                'venue' not in text.lower() and
-                'date' not in text.lower() and
-                not text.startswith('R') and
-                'ticketpro' not in text.lower()):
-                return self._clean_description(text)
+        text = page.text_blocks.find_block(
+            'p', longer_than=100,
+            exclude=('ticket', 'price', 'venue', 'date', 'ticketpro'), exclude_prefix='R')
+        if text is not None:
+            return self._clean_description(text)
         
         return ""
     
@@ -133,9 +130,9 @@ class TicketproScraper(BaseScraper):
         
         return text
     
-    def _extract_venue_and_location(self, soup: BeautifulSoup) -> tuple[str, str]:
+    def _extract_venue_and_location(self, page: ParsedPage) -> tuple[str, str]:
         """Extract venue and location information."""
-        page_text = soup.get_text()
+        page_text = page.text
         
         # Look for location patterns in the page text
         location_patterns = [
@@ -164,115 +161,63 @@ class TicketproScraper(BaseScraper):
         
         return "Venue not specified", "Location not specified"
     
-    def _extract_dates(self, soup: BeautifulSoup) -> tuple[Optional[datetime], Optional[datetime]]:
+    def _extract_dates(self, page: ParsedPage) -> tuple[Optional[datetime], Optional[datetime]]:
         """Extract start and end dates."""
-        page_text = soup.get_text()
+        page_text = page.text
         
-        # Look for date patterns like "Dec 06" or "12/06/2025"
-        date_patterns = [
-            r'(\w{3}\s+\d{1,2})',  # "Dec 06"
-            r'(\d{1,2}/\d{1,2}/\d{4})',  # "12/06/2025"
-        ]
-        
-        # Look for time patterns like "1:00 PM - 11:59 PM"
-        time_range_pattern = r'(\d{1,2}:\d{2}\s*(?:AM|PM))\s*[-–]\s*(\d{1,2}:\d{2}\s*(?:AM|PM))'
-        time_range_match = re.search(time_range_pattern, page_text)
-        
-        # Find the date
+        # Find the date: "Dec 06" (current year) or "12/06/2025"
         event_date = None
-        for pattern in date_patterns:
-            match = re.search(pattern, page_text)
+        match = dates.MONTH_DAY_RE.search(page_text)
+        if match:
+            event_date = dates.parse_month_day(match.group(), datetime.now().year)
+        if not event_date:
+            match = dates.US_DATE_RE.search(page_text)
             if match:
-                date_str = match.group(1)
-                try:
-                    if '/' in date_str:  # "12/06/2025" format
-                        event_date = datetime.strptime(date_str, '%m/%d/%Y')
-                    else:  # "Dec 06" format - assume current year
-                        current_year = datetime.now().year
-                        event_date = datetime.strptime(f"{date_str} {current_year}", '%b %d %Y')
-                    break
-                except ValueError:
-                    continue
+                event_date = dates.parse_us_date(match.group())
         
         if not event_date:
             return None, None
         
-        # Parse the time range
+        # Parse a time range like "1:00 PM - 11:59 PM"
+        time_range_match = dates.TIME_RANGE_12H_RE.search(page_text)
         if time_range_match:
-            try:
-                start_time_str = time_range_match.group(1)
-                end_time_str = time_range_match.group(2)
-                
-                # Parse times
-                start_time = datetime.strptime(start_time_str, '%I:%M %p')
-                end_time = datetime.strptime(end_time_str, '%I:%M %p')
-                
-                # Combine date and time
-                start_date = datetime(
-                    event_date.year, event_date.month, event_date.day,
-                    start_time.hour, start_time.minute
-                )
-                
-                # Handle end date - if end time is earlier than start time, it's next day
-                if end_time.hour < start_time.hour:
-                    event_date = datetime(
-                        event_date.year, event_date.month, event_date.day + 1
-                    )
-                
-                end_date = datetime(
-                    event_date.year, event_date.month, event_date.day,
-                    end_time.hour, end_time.minute
-                )
-                
+            start_time = dates.parse_time_12h(time_range_match.group(1))
+            end_time = dates.parse_time_12h(time_range_match.group(2))
+            if start_time and end_time:
+                start_date = event_date.replace(hour=start_time[0], minute=start_time[1])
+                end_date = event_date.replace(hour=end_time[0], minute=end_time[1])
+                # If the end time is earlier than the start time, it's the next day
+                if end_time[0] < start_time[0]:
+                    end_date += timedelta(days=1)
                 return start_date, end_date
-                
-            except ValueError:
-                pass
         
         # Fallback: single time with 4-hour default duration
-        single_time_pattern = r'(\d{1,2}:\d{2}\s*(?:AM|PM))'
-        time_match = re.search(single_time_pattern, page_text)
+        time_match = dates.TIME_12H_RE.search(page_text)
         if time_match:
-            try:
-                time_str = time_match.group(1)
-                time_obj = datetime.strptime(time_str, '%I:%M %p')
-                
-                start_date = datetime(
-                    event_date.year, event_date.month, event_date.day,
-                    time_obj.hour, time_obj.minute
-                )
-                
-                # Add 4 hours for end time if no end time found
-                from datetime import timedelta
-                end_date = start_date + timedelta(hours=4)
-                
-                return start_date, end_date
-                
-            except ValueError:
-                pass
+            start_time = dates.parse_time_12h(time_match.group())
+            if start_time:
+                start_date = event_date.replace(hour=start_time[0], minute=start_time[1])
+                return start_date, start_date + timedelta(hours=4)
         
         # Last resort: date only with default times
-        start_date = datetime(
-            event_date.year, event_date.month, event_date.day,
-            17, 0  # Default 5:00 PM
-        )
+        start_date = event_date.replace(hour=17, minute=0)  # Default 5:00 PM
         end_date = start_date + timedelta(hours=4)  # Default 9:00 PM
         
         return start_date, end_date
     
-    def _extract_image_url(self, soup: BeautifulSoup, base_url: str) -> Optional[str]:
+    def _extract_image_url(self, page: ParsedPage, base_url: str) -> Optional[str]:
         """Extract the event image URL."""
         # Look for various image patterns
         image_selectors = [
-            soup.find('meta', {'property': 'og:image'}),
-            soup.find('img', {'alt': lambda x: x and 'event' in x.lower()}),
-            soup.find('img', class_='event-image'),
-            soup.find('img', {'data-testid': 'event-image'})
+            page.meta_tags.get(('property', 'og:image')),
+            next((img for img in page.images if img.get('alt') and 'event' in img.get('alt').lower()), None),
+            next((img for img in page.images if 'event-image' in img.get('class', '').split()), None),
+            next((img for img in page.images if img.get('data-testid') == 'event-image'), None)
         ]
         
         for selector in image_selectors:
-            if selector:
-                if selector.name == 'meta':
+            if selector is not None:
+                if selector.tag == 'meta':
                     img_src = selector.get('content')
                 else:
                     img_src = selector.get('src')
@@ -283,8 +228,7 @@ class TicketproScraper(BaseScraper):
                     return urljoin(base_url, img_src)
         
         # Fallback: look for any meaningful image
-        all_imgs = soup.find_all('img')
-        for img in all_imgs:
+        for img in page.images:
             src = img.get('src', '')
             alt = img.get('alt', '')
             if (src and 
@@ -298,56 +242,21 @@ class TicketproScraper(BaseScraper):
         
         return None
     
-    def _extract_prices(self, soup: BeautifulSoup) -> list[Dict[str, str]]:
+    def _extract_prices(self, page: ParsedPage) -> List[Price]:
         """Extract pricing information."""
-        prices = []
-        page_text = soup.get_text()
+        page_text = page.text
         
         # Look for "Tickets start at" or "from" patterns first - these are usually the starting prices
-        start_price_patterns = [
-            r'Tickets? start at\s+(?:ZAR\s+)?R?(\d+(?:\.\d{2})?)',
-            r'from\s+(?:ZAR\s+)?R?(\d+(?:\.\d{2})?)',
-            r'Starting from\s+(?:ZAR\s+)?R?(\d+(?:\.\d{2})?)'
-        ]
-        
-        for pattern in start_price_patterns:
-            matches = re.findall(pattern, page_text, re.IGNORECASE)
-            for match in matches:
-                try:
-                    price_value = float(match)
-                    if price_value > 0:
-                        prices.append({
-                            'type': 'General',
-                            'price': f'R{price_value:.0f}' if price_value.is_integer() else f'R{price_value}'
-                        })
-                        return prices  # Return the first valid starting price found
-                except ValueError:
-                    continue
+        for pattern in START_PRICE_PATTERNS:
+            for match in pattern.finditer(page_text):
+                amount = to_amount(match.group(1))
+                if amount:
+                    return [Price(amount=amount)]  # Return the first valid starting price found
         
         # If no starting price found, look for all realistic ticket prices
-        all_price_patterns = [
-            r'ZAR\s+(\d+(?:\.\d{2})?)',
-            r'R(\d+(?:\.\d{2})?)'
-        ]
-        
-        all_prices = []
-        for pattern in all_price_patterns:
-            matches = re.findall(pattern, page_text)
-            for match in matches:
-                try:
-                    price_value = float(match)
-                    # Filter for realistic ticket prices (between R50 and R5000)
-                    if 50 <= price_value <= 5000:
-                        all_prices.append(price_value)
-                except ValueError:
-                    continue
-        
-        if all_prices:
-            # Get the lowest realistic price
-            min_price = min(all_prices)
-            prices.append({
-                'type': 'General',
-                'price': f'R{min_price:.0f}' if min_price.is_integer() else f'R{min_price}'
-            })
+        # (between R50 and R5000) and keep the lowest
+        all_prices = [amount for pattern in (ZAR_RE, RAND_RE)
+                      for amount in map(to_amount, pattern.findall(page_text))
+                      if 50 <= amount <= 5000]
         
-        return prices
+        return [Price(amount=min(all_prices))] if all_prices else []
@@ -0,0 +1,202 @@
+"""
+Shared HTTP transport for the scrapers, extractor functions and Places client.
+
+Every request goes through one pooled ``requests.Session`` so repeat visits to
+the same host reuse a keep-alive connection instead of paying a new TCP+TLS
+handshake per URL, and through a RequestGovernor so parallel scraping stays
+inside each platform's rate and concurrency budget. Transient failures are
+retried with backoff behind a per-platform circuit breaker, and pages from
+the ticketing platforms are kept in an on-disk HttpCache and revalidated with
+conditional GETs.
+"""
+
+import threading
+import time
+from collections import Counter
+from typing import Optional, Dict, Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.models import PreparedRequest
+from requests.structures import CaseInsensitiveDict
+
+from .http_cache import CacheEntry, HttpCache
+from .rate_limit import PlatformLimits, RequestGovernor
+from .resilience import CircuitBreakers, RetryPolicy, RETRY_STATUSES, TRANSIENT_EXCEPTIONS
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept-Language': 'en-US,en;q=0.9',
+}
+
+# Number of distinct hosts to keep pools for (the five ticketing sites, their
+# sub-domains, api.quicket.co.za and maps.googleapis.com) and the number of
+# keep-alive connections held open per host.
+DEFAULT_POOL_CONNECTIONS = 16
+DEFAULT_POOL_MAXSIZE = 20
+DEFAULT_TIMEOUT = 10
+
+
+class HttpTransport:
+    """Pooled HTTP client shared by everything that talks to the network."""
+
+    def __init__(self,
+                 pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                 headers: Optional[Dict[str, str]] = None,
+                 timeout: float = DEFAULT_TIMEOUT,
+                 limits: Optional[Dict[str, PlatformLimits]] = None,
+                 cache: Optional[HttpCache] = None,
+                 retry: Optional[RetryPolicy] = None,
+                 breaker_options: Optional[Dict[str, Any]] = None):
+        self.timeout = timeout
+        self.governor = RequestGovernor(limits)
+        self.cache = cache
+        self.retry = retry or RetryPolicy()
+        self.breakers = CircuitBreakers(**(breaker_options or {}))
+        self.retries = Counter()
+        self.retries_lock = threading.Lock()
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS if headers is None else headers)
+
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Default headers sent with every request."""
+        return dict(self.session.headers)
+
+    def _send(self, url: str, **kwargs: Any) -> requests.Response:
+        key = self.governor.key_for_url(url)
+        breaker = self.breakers.get(key)
+        attempt = 0
+        while True:
+            breaker.before_request()
+            try:
+                with self.governor.slot(url) as waited:
+                    response = self.session.get(url, **kwargs)
+            except TRANSIENT_EXCEPTIONS:
+                breaker.record_failure()
+                if attempt >= self.retry.max_retries or breaker.is_open:
+                    raise
+                delay = self.retry.delay(attempt)
+            except Exception:
+                breaker.cancel_probe()
+                raise
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    breaker.record_success()
+                    break
+                breaker.record_failure()
+                if attempt >= self.retry.max_retries or breaker.is_open:
+                    break
+                delay = self.retry.delay(attempt, response)
+                response.close()
+            with self.retries_lock:
+                self.retries[key] += 1
+            attempt += 1
+            time.sleep(delay)
+
+        response.queue_wait = waited
+        response.from_cache = False
+        return response
+
+    @staticmethod
+    def _cached_response(entry: CacheEntry, url: str, queue_wait: float = 0.0) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response._content = entry.body
+        response.headers = CaseInsensitiveDict(entry.headers)
+        response.encoding = entry.encoding
+        response.url = url
+        response.queue_wait = queue_wait
+        response.from_cache = True
+        response.cache_digest = entry.digest
+        return response
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a GET request over the pooled session once the platform's governor
+        grants a slot. The seconds spent queueing are set on
+        ``response.queue_wait``.
+
+        Cacheable URLs are answered from disk while fresh (``response.from_cache``)
+        and otherwise revalidated with If-None-Match / If-Modified-Since; a 304
+        is turned back into the cached 200 response.
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        ttl = self.cache.ttl_for(url) if self.cache is not None else None
+        if ttl is None:
+            return self._send(url, **kwargs)
+
+        prepared = PreparedRequest()
+        prepared.prepare_url(url, kwargs.get('params'))
+        cache_url = prepared.url
+
+        entry = self.cache.load(cache_url)
+        if entry is not None:
+            if entry.is_fresh(ttl):
+                return self._cached_response(entry, url)
+            kwargs['headers'] = {**entry.conditional_headers(), **(kwargs.get('headers') or {})}
+
+        response = self._send(url, **kwargs)
+        if entry is not None and response.status_code == 304:
+            entry = self.cache.touch(entry, response.headers)
+            return self._cached_response(entry, url, response.queue_wait)
+        if response.status_code == 200:
+            entry = self.cache.store(cache_url, response.content, response.headers, response.encoding)
+            response.cache_digest = entry.digest
+        return response
+
+    def revalidate(self, url: str, **kwargs: Any) -> Optional[requests.Response]:
+        """
+        Bring the cache entry for ``url`` up to date, downloading only if the
+        page changed. Returns the response, whose ``cache_digest`` is the
+        digest of the current body when it is a 200, or None when the URL is
+        not cacheable. ``kwargs`` are passed to get().
+        """
+        if self.cache is None or self.cache.ttl_for(url) is None:
+            return None
+        return self.get(url, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-platform transport metrics: queue waits, retries and breaker state."""
+        return {
+            'queue_wait': self.governor.stats(),
+            'retries': dict(self.retries.copy()),
+            'circuits': self.breakers.stats(),
+        }
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        self.session.close()
+
+
+_default_transport: Optional[HttpTransport] = None
+_default_lock = threading.Lock()
+
+
+def get_transport() -> HttpTransport:
+    """Return the process-wide transport, creating it on first use."""
+    global _default_transport
+    if _default_transport is None:
+        with _default_lock:
+            if _default_transport is None:
+                _default_transport = HttpTransport(cache=HttpCache())
+    return _default_transport
+
+
+def configure_transport(**kwargs: Any) -> HttpTransport:
+    """
+    Replace the process-wide transport with one built from ``kwargs``.
+    Pass ``cache=None`` to turn the on-disk cache off.
+    """
+    kwargs.setdefault('cache', HttpCache())
+    global _default_transport
+    with _default_lock:
+        if _default_transport is not None:
+            _default_transport.close()
+        _default_transport = HttpTransport(**kwargs)
+    return _default_transport
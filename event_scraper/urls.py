@@ -0,0 +1,93 @@
+"""
+URL helpers shared by the scrapers, the transport layer and the pipeline.
+
+canonical_url strips tracking parameters and fragments so the same event
+always maps to the same cache and in-flight key, and event_key reduces an
+event URL to a stable platform key (Quicket event id, Webtickets itemid,
+Computicket slug, ...) for deduplication.
+"""
+
+import re
+from functools import lru_cache
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# Same keys, patterns and order as identify_platform.
+PLATFORM_PATTERNS = {
+    'quicket': re.compile(r'quicket', re.IGNORECASE),
+    'howler': re.compile(r'howler', re.IGNORECASE),
+    'webtickets': re.compile(r'webtickets', re.IGNORECASE),
+    'computicket': re.compile(r'computicket', re.IGNORECASE),
+    'ticketpro': re.compile(r'ticketpro', re.IGNORECASE),
+}
+
+# Query parameters that only carry attribution and never change the page.
+TRACKING_PARAMS = frozenset({
+    '_gl', '_ga', 'ref', 'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid',
+    'igshid', 'mc_cid', 'mc_eid',
+})
+TRACKING_PREFIXES = ('utm_',)
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+# Path patterns that hold each platform's stable event identifier.
+EVENT_KEY_PATTERNS = {
+    'quicket': re.compile(r'/events/(\d+)'),
+    'howler': re.compile(r'/events/([^/?#]+)'),
+    'computicket': re.compile(r'/e/([^/?#]+)'),
+    'ticketpro': re.compile(r'/event/([^/?#]+)'),
+}
+
+
+def platform_for_url(url: str) -> str:
+    """Return the ticketing platform key for a URL, or 'unknown'."""
+    for platform, pattern in PLATFORM_PATTERNS.items():
+        if pattern.search(url):
+            return platform
+    return 'unknown'
+
+
+def _is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+@lru_cache(maxsize=4096)
+def canonical_url(url: str) -> str:
+    """
+    Normalise a URL: lower-case scheme and host, drop default ports,
+    tracking parameters and the fragment, and sort the remaining query.
+    """
+    parts = urlsplit(url.strip())
+    scheme = (parts.scheme or 'https').lower()
+    host = (parts.hostname or '').lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+
+    query = sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking_param(name)
+    )
+    return urlunsplit((scheme, host, parts.path or '/', urlencode(query), ''))
+
+
+@lru_cache(maxsize=4096)
+def event_key(url: str) -> str:
+    """
+    Stable identity for an event URL, e.g. 'quicket:360940' or
+    'webtickets:1573126494'. Falls back to the canonical URL when the
+    platform's identifier cannot be found.
+    """
+    canonical = canonical_url(url)
+    platform = platform_for_url(urlsplit(canonical).netloc)
+
+    if platform == 'webtickets':
+        for name, value in parse_qsl(urlsplit(canonical).query):
+            if name.lower() == 'itemid' and value:
+                return f"webtickets:{value}"
+    elif platform in EVENT_KEY_PATTERNS:
+        match = EVENT_KEY_PATTERNS[platform].search(urlsplit(canonical).path)
+        if match:
+            return f"{platform}:{match.group(1)}"
+
+    return canonical
@@ -7,7 +7,10 @@ from src.logger import logging
 from src.components.base_functions.get_event_urls import get_event_urls_from_users
 from src.components.base_functions.identify_platform import identify_platform
 from src.components.base_functions.initialize_firebase import initialize_firebase
+from src.components.base_functions.event_store import FirestoreEventStore
+from src.components.base_functions.event_writer import EventWriter
 from src.components.base_functions.process_event_urls import process_event_url
+from src.components.base_scrapers.event_function import scrape_events
 from firebase_admin import storage
 from googleapiclient.http import MediaFileUpload
 # from google.oauth2.credentials import Credentials
@@ -41,11 +44,14 @@ def main():
         print("⚠️  No event URLs found or missing environment variables.")
         logging.info("⚠️  No event URLs found or missing environment variables.")
     
-    # Process each event URL
+    # Scrape every page concurrently, then process each event URL
     print(f"Processing {len(event_urls)} events...")
     logging.info(f"Processing {len(event_urls)} events...")
     success_count = 0
     total_count = len(event_urls)
+    scraped = scrape_events(event_urls) if event_urls else {}
+    # One writer for the run, so the events are committed in batches
+    writer = EventWriter(FirestoreEventStore(db))
     
     for index, url in enumerate(event_urls, 1):
         print(f"\n--- Event {index}/{total_count} ---")
@@ -56,9 +62,14 @@ def main():
         print(f"Platform identified: {platform}")
         
         # Process the event
-        if process_event_url(url, db):
+        if process_event_url(url, db, scraped=scraped.get(url), writer=writer):
             success_count += 1
     
+    failures = writer.close()
+    success_count -= len(failures)
+    print(f"Wrote {writer.writes} documents in {writer.commits} batch commits")
+    logging.info(f"Wrote {writer.writes} documents in {writer.commits} batch commits, failures: {failures}")
+    
     print(f"\n=== Processing Complete ===")
     print(f"Successfully processed: {success_count}/{total_count} events")
     print(f"Failed: {total_count - success_count} events")
@@ -0,0 +1,165 @@
+"""
+Micro-benchmark of event_scraper.dates against the strptime-based parsing
+the scrapers used before.
+
+"before" reproduces the old code paths: three strptime formats per
+Computicket string, strptime('%b') per Howler month name, and strptime for
+Webtickets and Quicket. "after" calls the compiled parsers, which sit
+behind lru_cache, so they are timed twice:
+
+- uncached: every call gets a distinct string, with the caches cleared
+  first, so each call pays for the regex and the datetime construction;
+- cached: a small set of strings recurs, as on real pages, so after one
+  warm-up pass every call is a cache hit.
+
+"before" is timed on the same distinct strings as "after, uncached". Both
+sides are checked to agree on every input first.
+
+Usage: python research/bench_dates.py [--repeat 2000] [--distinct 20000]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from event_scraper import dates
+
+
+def old_computicket(datetime_str):
+    datetime_str = datetime_str.strip()
+    if re.search(r'\d{1,2}:\d{2}\s+PM', datetime_str):
+        time_match = re.search(r'(\d{1,2}):(\d{2})\s+PM', datetime_str)
+        if time_match and int(time_match.group(1)) >= 13:
+            datetime_str = datetime_str.replace(' PM', '')
+    for fmt in ('%a %d %b %Y, %I:%M %p', '%a %d %b %Y, %H:%M', '%a %d %b %Y, %I:%M'):
+        try:
+            return datetime.strptime(datetime_str, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def old_howler(date_string, alt_date):
+    match = re.search(r"(\d{2}:\d{2}) (\d{1,2}) (\w{3}) (\d{4}) - (\d{2}:\d{2}) (\d{1,2}) (\w{3}) (\d{4})", date_string)
+    if not match:
+        return None, None
+    start_hour, start_minute = map(int, match.group(1).split(":"))
+    end_hour, end_minute = map(int, match.group(5).split(":"))
+    start_month = datetime.strptime(match.group(3), "%b").month
+    end_month = datetime.strptime(match.group(7), "%b").month
+    return (datetime(int(match.group(4)), start_month, int(match.group(2)), start_hour, start_minute),
+            datetime(int(match.group(8)), end_month, int(match.group(6)), end_hour, end_minute))
+
+
+def old_webtickets(value):
+    return datetime.strptime(value, '%d %b %Y %H:%M')
+
+
+def old_quicket(value):
+    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S")
+
+
+CASES = {
+    'computicket': (old_computicket, dates.parse_computicket_datetime,
+                    [('Sat 29 Nov 2025, 12:00 PM',), ('Sun 30 Nov 2025, 06:00 AM',),
+                     ('Fri 05 Dec 2025, 18:00 PM',), ('Sat 06 Dec 2025, 19:30',)]),
+    'howler': (old_howler, dates.parse_howler_dates,
+               [('13:00 8 Mar 2025 - 02:00 9 Mar 2025 SAST (+02:00)', '8 Mar - 9 Mar SAST (+02:00)'),
+                ('18:00 14 Feb 2025 - 23:30 14 Feb 2025 SAST (+02:00)', '14 Feb SAST (+02:00)')]),
+    'webtickets': (old_webtickets, dates.parse_day_month_year_time,
+                   [('06 Dec 2025 12:00',), ('13 Dec 2025 19:30',), ('31 Dec 2025 21:00',)]),
+    'quicket': (old_quicket, dates.parse_iso,
+                [('2025-03-08T13:00:00',), ('2025-03-09T02:00:00',)]),
+}
+
+
+def distinct_computicket(when, i):
+    return (when.strftime('%a %d %b %Y, %I:%M %p' if i % 2 else '%a %d %b %Y, %H:%M'),)
+
+
+def distinct_howler(when, i):
+    end = when + timedelta(hours=i % 9 + 1)
+    return (f'{when:%H:%M} {when.day} {when:%b %Y} - {end:%H:%M} {end.day} {end:%b %Y} SAST (+02:00)',
+            f'{when.day} {when:%b} - {end.day} {end:%b} SAST (+02:00)')
+
+
+def distinct_webtickets(when, i):
+    return (when.strftime('%d %b %Y %H:%M'),)
+
+
+def distinct_quicket(when, i):
+    return (when.strftime('%Y-%m-%dT%H:%M:%S'),)
+
+
+DISTINCT = {
+    'computicket': distinct_computicket,
+    'howler': distinct_howler,
+    'webtickets': distinct_webtickets,
+    'quicket': distinct_quicket,
+}
+
+# lru_cache-wrapped functions behind each public parser
+CACHES = {
+    'computicket': [dates.parse_computicket_datetime],
+    'howler': [dates._parse_howler_dates],
+    'webtickets': [dates.parse_day_month_year_time],
+    'quicket': [dates.parse_iso],
+}
+
+
+def distinct_inputs(name, count):
+    """count strings of one platform's format, all different (minutes apart)."""
+    start = datetime(2025, 1, 1, 0, 0)
+    return [DISTINCT[name](start + timedelta(minutes=7 * i), i) for i in range(count)]
+
+
+def measure(parse, inputs, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for args in inputs:
+            parse(*args)
+    return (time.perf_counter() - start) / (repeat * len(inputs))
+
+
+def clear_caches(name):
+    for cached in CACHES[name]:
+        cached.cache_clear()
+
+
+def cache_misses(name):
+    return sum(cached.cache_info().misses for cached in CACHES[name])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=2000)
+    parser.add_argument('--distinct', type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{'parser':<12} {'before us':>10} {'uncached us':>12} {'speedup':>8} "
+          f"{'cached us':>10} {'speedup':>8}")
+    for name, (old, new, recurring) in CASES.items():
+        distinct = distinct_inputs(name, args.distinct)
+        for case in recurring + distinct:
+            assert old(*case) == new(*case), (name, case)
+
+        before = measure(old, distinct, 1)
+        clear_caches(name)
+        uncached = measure(new, distinct, 1)
+        assert cache_misses(name) == len(distinct), name
+
+        clear_caches(name)
+        measure(new, recurring, 1)
+        cached = measure(new, recurring, args.repeat)
+        assert cache_misses(name) == len(recurring), name
+        print(f"{name:<12} {before * 1e6:>10.2f} {uncached * 1e6:>12.2f} {before / uncached:>7.1f}x "
+              f"{cached * 1e6:>10.2f} {before / cached:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
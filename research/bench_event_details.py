@@ -0,0 +1,85 @@
+"""
+Per-event cost of building EventDetails with and without validation.
+
+"EventDetails(...)" is what the scrapers use: full pydantic validation,
+including both HttpUrl fields. "model_construct" skips validation
+altogether (with the default factories passed in, since resolving them is
+the expensive part of model_construct). "model_construct + batch" is the
+deferred alternative: build unvalidated, then validate the whole run once
+with TypeAdapter(List[EventDetails]). With pydantic-core doing the
+validation, EventDetails(...) costs little more than model_construct, so
+the scrapers keep validating every record they build.
+
+The pydantic version is printed with the results; compare on the version
+pinned in requirements.txt.
+
+Usage: python research/bench_event_details.py [--events 1000] [--repeat 20]
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+from decimal import Decimal
+from typing import List
+
+import pydantic
+from pydantic import TypeAdapter
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from event_scraper.models import EventDetails, Price
+
+
+def fields(i):
+    return dict(
+        title=f'Event {i}',
+        description='An evening of live music.\nDoors open at 18:00.',
+        venue='The Baxter Theatre',
+        location='Main Rd, Rondebosch, Cape Town',
+        start_date=datetime(2025, 3, 8, 19, 0),
+        end_date=datetime(2025, 3, 8, 23, 0),
+        prices=[Price(amount=Decimal('150'), tier='General'),
+                Price(amount=Decimal('350'), tier='VIP', sold_out=True)],
+        image_url=f'https://images.example.co.za/events/{i}.jpg',
+        event_url=f'https://www.webtickets.co.za/v2/event.aspx?itemid={i}',
+        source='webtickets',
+        raw_data={'title': f'Event {i}'},
+    )
+
+
+def measure(run, repeat, count):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        run()
+    return (time.perf_counter() - start) / (repeat * count)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--events', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    inputs = [fields(i) for i in range(args.events)]
+    events = TypeAdapter(List[EventDetails])
+    assert events.validate_python(inputs) == [EventDetails(**f) for f in inputs]
+
+    def construct_then_validate():
+        constructed = [EventDetails.model_construct(**f) for f in inputs]
+        return events.validate_python([event.__dict__ for event in constructed])
+
+    cases = [
+        ('EventDetails(...)', lambda: [EventDetails(**f) for f in inputs]),
+        ('model_construct', lambda: [EventDetails.model_construct(**f) for f in inputs]),
+        ('model_construct + batch', construct_then_validate),
+    ]
+    print(f"pydantic {pydantic.VERSION}")
+    print(f"{'case':<24} {'us/event':>9}")
+    for name, run in cases:
+        print(f"{name:<24} {measure(run, args.repeat, args.events) * 1e6:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Save-stage throughput of the pipeline against a local SQLiteEventStore.
+
+Synthetic events (spread over a few hundred venues) go through the same
+ExistenceIndex and EventWriter the pipeline uses. The first pass stores
+them all; the second pass finds them all in the index and writes nothing,
+like re-importing the same sheet. No Firebase project is needed.
+
+To run the whole pipeline offline, scraping included, pass a store:
+    eventPipeline(urls, store=SQLiteEventStore('events.sqlite'))
+
+Usage: python research/bench_event_store.py [--events 5000] [--venues 300] [--db PATH]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.components.base_functions.event_store import SQLiteEventStore
+from src.components.base_functions.event_writer import EventWriter
+from src.components.base_functions.existence_index import ExistenceIndex
+
+
+def event(i, venues):
+    start = datetime(2025, 3, 8, 19, 0) + timedelta(days=i % 90)
+    return {
+        'name': f'Event {i}',
+        'description': 'An evening of live music.',
+        'paymentPortal': f'https://www.quicket.co.za/events/{100000 + i}-event-{i}/',
+        'price': 150.0,
+        'startDate': start,
+        'endDate': start + timedelta(hours=4),
+        'managerAccount': 'bench',
+        'venueId': '',
+    }, {
+        'id': f'ChIJbench{i % venues}',
+        'formattedAddress': 'Cape Town',
+        'location': {'lat': -33.9, 'lng': 18.4},
+        'displayName': f'Venue {i % venues}',
+        'managerAccount': 'bench',
+    }
+
+
+def save_all(store, events):
+    start = time.perf_counter()
+    index = ExistenceIndex(store).load()
+    loaded = time.perf_counter()
+    writer = EventWriter(store, index)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i, (event_info, venue) in enumerate(events):
+            writer.save(f'bench-{i}', dict(event_info), venue)
+        failures = writer.close()
+    return loaded - start, time.perf_counter() - loaded, writer, failures
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--events', type=int, default=5000)
+    parser.add_argument('--venues', type=int, default=300)
+    parser.add_argument('--db', help="SQLite file to use (default: a temporary one)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SQLiteEventStore(args.db or os.path.join(tmp, 'events.sqlite'))
+        events = [event(i, args.venues) for i in range(args.events)]
+        for label in ('new events', 'all existing'):
+            load_time, save_time, writer, failures = save_all(store, events)
+            print(f"{label:>12}: index load {load_time * 1000:.0f}ms, save {save_time:.2f}s "
+                  f"({args.events / save_time:,.0f} events/s), {writer.writes} writes in "
+                  f"{writer.commits} commits, {len(failures)} failures")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark for BaseScraper.extract_many against the sequential extraction loop.
+
+Serves a Computicket-style fixture page from a local HTTP server that adds a
+fixed delay per request (to stand in for network latency), then scrapes the
+same 200 fixture URLs sequentially and with extract_many and compares wall
+time and output.
+
+Usage: python research/bench_extract_many.py [--urls 200] [--latency 0.2] [--concurrency 20]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from event_scraper.computicket_scraper import ComputicketScraper
+from event_scraper.rate_limit import PlatformLimits
+from event_scraper.transport import configure_transport
+
+FIXTURE_HTML = """<html><head><title>Fixture Event</title></head><body>
+<h1 class="mt-4">Fixture Event {n}</h1>
+<img src="https://example.com/images/event-{n}.jpg">
+<p>A long enough description of fixture event number {n} for the benchmark.</p>
+<p>Fixture Venue, Cape Town, South Africa</p>
+<p>Sat 29 Nov 2025, 12:00 PM - Sun 30 Nov 2025, 06:00 AM</p>
+<div><span>Tickets start at R 200.00</span></div>
+</body></html>"""
+
+
+def serve(latency):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            body = FIXTURE_HTML.format(n=self.path.rsplit('/', 1)[-1]).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def collect(urls, concurrency):
+    results = {}
+    async for url, event in ComputicketScraper.extract_many(urls, max_concurrency=concurrency):
+        results[url] = event
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--urls', type=int, default=200)
+    parser.add_argument('--latency', type=float, default=0.2)
+    parser.add_argument('--concurrency', type=int, default=20)
+    args = parser.parse_args()
+
+    server = serve(args.latency)
+    host = f"127.0.0.1:{server.server_address[1]}"
+    # The fixture server is not a real platform, so leave it ungoverned.
+    configure_transport(pool_maxsize=args.concurrency, limits={host: PlatformLimits()})
+    base = f"http://{host}/e"
+    urls = [f"{base}/{n}" for n in range(args.urls)]
+
+    scraper = ComputicketScraper()
+    start = time.perf_counter()
+    sequential = {url: scraper.extract_event_details(url) for url in urls}
+    sequential_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    concurrent = asyncio.run(collect(urls, args.concurrency))
+    concurrent_time = time.perf_counter() - start
+
+    server.shutdown()
+
+    identical = all(sequential[url] == concurrent.get(url) for url in urls)
+    print(f"URLs: {len(urls)}, latency: {args.latency}s, concurrency: {args.concurrency}")
+    print(f"Sequential loop:  {sequential_time:.2f}s")
+    print(f"extract_many:     {concurrent_time:.2f}s ({sequential_time / concurrent_time:.1f}x)")
+    print(f"Identical output: {identical}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Recall and latency of the venue gazetteer over historical venue strings.
+
+Each historical string is a venue name as a scraper produced it, labelled
+with the place_id Places resolved it to. By default these come from the
+Places cache (.places_cache.sqlite); a TSV of "venue<TAB>place_id" lines
+can be given instead. The gazetteer is built from the Places names of the
+labelled places only (with a TSV, the first string of each place stands
+in for it), so the other strings have to be matched fuzzily rather than
+found under their own spelling. For each threshold the script prints how
+many strings resolve to the right place, to a wrong one, or to nothing
+(and would go to Places), plus the per-lookup latency.
+
+Usage: python research/bench_gazetteer.py [--strings venues.tsv] [--thresholds 0.65 0.75 0.85]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from event_scraper.gazetteer import MATCH_THRESHOLD, VenueGazetteer
+from event_scraper.places_cache import get_places_cache
+
+
+def load_strings(path):
+    with open(path, encoding='utf-8') as f:
+        rows = [line.rstrip('\n').split('\t') for line in f if line.strip()]
+    return [(venue, place_id) for venue, place_id in rows]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--strings', help="TSV of venue string and expected place_id")
+    parser.add_argument('--thresholds', type=float, nargs='+', default=[0.65, MATCH_THRESHOLD, 0.85])
+    args = parser.parse_args()
+
+    if args.strings:
+        labelled = load_strings(args.strings)
+        candidates = {}
+        for venue, place_id in labelled:
+            candidates.setdefault(place_id, {'place_id': place_id, 'name': venue})
+    else:
+        labelled, candidates = [], {}
+        for name, place_info in get_places_cache().found_places():
+            candidate = place_info['candidates'][0]
+            labelled.append((name, candidate['place_id']))
+            candidates.setdefault(candidate['place_id'], candidate)
+    if not labelled:
+        print("No historical venue strings found")
+        return
+
+    print(f"{len(labelled)} venue strings, {len(candidates)} places")
+    print(f"{'threshold':>9} {'right':>6} {'wrong':>6} {'places':>6} {'recall':>7} {'us/lookup':>10} {'p99 us':>8}")
+    for threshold in args.thresholds:
+        gazetteer = VenueGazetteer(threshold)
+        for candidate in candidates.values():
+            gazetteer.add(candidate['name'], candidate)
+
+        right = wrong = unmatched = 0
+        timings = []
+        for venue, place_id in labelled:
+            start = time.perf_counter()
+            found = gazetteer.match(venue)
+            timings.append(time.perf_counter() - start)
+            if found is None:
+                unmatched += 1
+            elif found[0]['place_id'] == place_id:
+                right += 1
+            else:
+                wrong += 1
+        timings.sort()
+        mean = sum(timings) / len(timings)
+        p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+        print(f"{threshold:>9.2f} {right:>6} {wrong:>6} {unmatched:>6} {right / len(labelled):>7.1%} "
+              f"{mean * 1e6:>10.1f} {p99 * 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Per-platform parse benchmark over saved HTML fixtures.
+
+Compares the old full-document parse (BeautifulSoup over the whole page with
+the parser each scraper used to hard-code) against the one lxml tree
+ParsedPage now builds, which every spec, text and image lookup reads.
+Reports mean parse time and peak traced memory per platform; tracemalloc
+only sees Python allocations, so the lxml tree's own memory is not counted.
+
+Fixtures are saved event pages laid out as <fixtures>/<platform>/*.html,
+by default the ones the tests use, e.g. tests/fixtures/howler/joburg-jazz-night.html.
+
+Usage: python research/bench_parsing.py [fixtures_dir] [--repeat 20]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from bs4 import BeautifulSoup
+
+from event_scraper.specs import build_tree
+
+# The parser each scraper used before.
+OLD_PARSERS = {
+    'howler': 'html.parser',
+    'webtickets': 'html.parser',
+    'ticketpro': 'html.parser',
+    'computicket': 'lxml',
+}
+
+
+def measure(parse, pages, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for page in pages:
+            parse(page)
+    elapsed = (time.perf_counter() - start) / (repeat * len(pages))
+
+    peak = 0
+    for page in pages:
+        tracemalloc.start()
+        parse(page)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('fixtures', nargs='?', default=os.path.join(os.path.dirname(__file__), '..', 'tests', 'fixtures'))
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'platform':<12} {'pages':>5} {'before ms':>10} {'after ms':>10} {'before KiB':>11} {'after KiB':>10}")
+    for platform, old_parser in OLD_PARSERS.items():
+        paths = sorted(glob.glob(os.path.join(args.fixtures, platform, '*.html')))
+        if not paths:
+            continue
+        pages = []
+        for path in paths:
+            with open(path, 'rb') as f:
+                pages.append(f.read())
+
+        before_time, before_peak = measure(lambda page: BeautifulSoup(page, old_parser), pages, args.repeat)
+        after_time, after_peak = measure(build_tree, pages, args.repeat)
+        print(f"{platform:<12} {len(pages):>5} {before_time * 1000:>10.2f} {after_time * 1000:>10.2f} "
+              f"{before_peak / 1024:>11.0f} {after_peak / 1024:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
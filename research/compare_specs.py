@@ -0,0 +1,146 @@
+"""
+Check the compiled XPath specs against the BeautifulSoup lookups they replaced.
+
+For every saved fixture (<fixtures>/<platform>/*.html, as for
+bench_parsing.py) the selector-driven fields are extracted twice: with the
+platform's PlatformSpec on an lxml tree, and with the soup.find() chains the
+scrapers used before. Any field where the two disagree is printed, followed
+by the mean time per page of each approach (parse included).
+
+Usage: python research/compare_specs.py [fixtures_dir] [--repeat 20]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from bs4 import BeautifulSoup
+
+from event_scraper.specs import PLATFORM_SPECS, build_tree
+
+
+def _text(elem):
+    return elem.get_text(strip=True) if elem else None
+
+
+def howler_reference(soup):
+    def chain(*classes):
+        node = soup
+        for class_name in classes:
+            node = node.find("div", class_=class_name) if node else None
+        return node
+
+    hero = chain("page-wrapper", "event-hero", "inset-x--large-on-medium", "event-hero__content")
+    carousel = chain("page-wrapper", "event-carousel", "event-section__content")
+    info = chain("page-wrapper", "event-bar", "event-bar__info")
+    venue = info.find("div", class_="event-detail event-detail__venue flex flex--align-items--center") if info else None
+    date = info.find("div", class_="event-detail event-detail__date flex flex--align-items--center") if info else None
+    action = chain("page-wrapper", "event-bar", "event-bar__action")
+    image = hero.find("img") if hero else None
+    link = action.find("a") if action else None
+    return {
+        'title': _text(hero.find("h1", class_="t-display")) if hero else None,
+        'description': [p.get_text(strip=True) for p in carousel.find_all("p")] if carousel else [],
+        'venue': _text(venue.find("h3")) if venue else None,
+        'location': _text(venue.find("a")) if venue else None,
+        'date_text': _text(date.find("a")) if date else None,
+        'date_alt': _text(date.find("h3")) if date else None,
+        'image_url': image.get("src") or None if image else None,
+        'purchase_path': link.get("href") or None if link else None,
+    }
+
+
+def webtickets_reference(soup):
+    title = soup.find('h1', id='PageHeaderPanel_pageHeader')
+    if title:
+        title = title.get_text(strip=True)
+    else:
+        title_tag = soup.find('title')
+        title = (title_tag.get('title') or title_tag.get_text(strip=True)) if title_tag else None
+    venue = None
+    for row in soup.find_all('div', class_='row'):
+        if 'Venue' in row.get_text() and row.find('div', class_='col-lg-8'):
+            venue = row.find('div', class_='col-lg-8').get_text(strip=True)
+            break
+    panels = soup.find_all('div', class_='ticket-panel')
+    return {
+        'title': title,
+        'description': _text(soup.find('div', class_='event-description')),
+        'venue': venue,
+        'panel_titles': [_text(p.find('div', class_='ticket-panel-title')) for p in panels
+                         if p.find('div', class_='ticket-panel-title')],
+        'panel_texts': [p.get_text() for p in panels],
+        'card_prices': [e.get_text(strip=True) for e in soup.find_all('div', class_='product-card-price')],
+    }
+
+
+def computicket_reference(soup):
+    return {'title': _text(soup.find('h1', class_='mt-4'))}
+
+
+def ticketpro_reference(soup):
+    title = soup.find('title')
+    return {
+        'h1': _text(soup.find('h1')),
+        'title_tag': title.get_text() if title else None,
+        'description_div': _text(soup.find('div', class_='description')),
+        'description_p': _text(soup.find('p', class_='description')),
+        'description_testid': _text(soup.find('div', {'data-testid': 'event-description'})),
+    }
+
+
+REFERENCES = {
+    'howler': howler_reference,
+    'webtickets': webtickets_reference,
+    'computicket': computicket_reference,
+    'ticketpro': ticketpro_reference,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('fixtures', nargs='?', default=os.path.join(os.path.dirname(__file__), '..', 'tests', 'fixtures'))
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'platform':<12} {'pages':>5} {'mismatches':>10} {'soup ms':>8} {'spec ms':>8}")
+    for platform, spec in PLATFORM_SPECS.items():
+        paths = sorted(glob.glob(os.path.join(args.fixtures, platform, '*.html')))
+        if not paths:
+            continue
+        pages = []
+        for path in paths:
+            with open(path, 'rb') as f:
+                pages.append((path, f.read()))
+
+        reference = REFERENCES[platform]
+        mismatches = 0
+        for path, markup in pages:
+            expected = reference(BeautifulSoup(markup, 'lxml'))
+            actual, _ = spec.evaluate(build_tree(markup))
+            for field, value in expected.items():
+                if actual[field] != value:
+                    mismatches += 1
+                    print(f"  {os.path.basename(path)} {field}: soup={value!r} spec={actual[field]!r}")
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for _, markup in pages:
+                reference(BeautifulSoup(markup, 'lxml'))
+        soup_time = (time.perf_counter() - start) / (args.repeat * len(pages))
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for _, markup in pages:
+                spec.evaluate(build_tree(markup))
+        spec_time = (time.perf_counter() - start) / (args.repeat * len(pages))
+
+        print(f"{platform:<12} {len(pages):>5} {mismatches:>10} {soup_time * 1000:>8.2f} {spec_time * 1000:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -35,7 +35,8 @@ def main():
             if event.prices:
                 print("\nPrices:")
                 for price in event.prices:
-                    print(f"  - {price['type']}: {price['price']}")
+                    sold_out = " (sold out)" if price.sold_out else ""
+                    print(f"  - {price.tier}: {price}{sold_out}")
             if event.image_url:
                 print(f"Image URL: {event.image_url}")
             
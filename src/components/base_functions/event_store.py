@@ -0,0 +1,243 @@
+"""
+Storage backends for the events and venues the pipeline writes.
+
+EventStore is the handful of operations the pipeline needs: list the
+stored event portals and venue Places ids (optionally only those written
+since a given time), look up one portal or one venue, and upsert events and
+venues in a batch. Upserts merge into the existing document like
+Firestore's set(merge=True) and stamp UPDATED_FIELD.
+
+FirestoreEventStore is the production store. SQLiteEventStore keeps the
+same documents in a local file, indexed on the same fields the Firestore
+queries use, so the whole pipeline can be run and load-tested offline.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, timezone
+from typing import Optional, Any, Dict, Iterator, List, Tuple
+
+from google.cloud.firestore import FieldFilter, SERVER_TIMESTAMP
+
+from event_scraper.http_cache import PROJECT_ROOT
+
+EVENTS = "events"
+VENUES = "whatstheplace"
+
+# Set to the write time on every document a store writes.
+UPDATED_FIELD = 'updatedAt'
+
+DEFAULT_SQLITE_STORE = os.path.join(PROJECT_ROOT, '.event_store.sqlite')
+
+
+class StoreBatch:
+    """Upserts committed together."""
+
+    def upsert_event(self, event_id: str, event: Dict[str, Any]) -> None:
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def upsert_venue(self, venue_id: str, venue: Dict[str, Any]) -> None:
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def commit(self) -> None:
+        raise NotImplementedError("Subclasses must implement this method")
+
+
+class EventStore:
+    """Events and venues as the pipeline reads and writes them."""
+
+    # Where ExistenceIndex keeps its snapshot of this store, if anywhere.
+    snapshot_path: Optional[str] = None
+
+    def event_portals(self, since: Optional[datetime] = None) -> Iterator[str]:
+        """paymentPortal of every stored event, or of those written since ``since``."""
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def venue_ids(self, since: Optional[datetime] = None) -> Iterator[Tuple[str, str]]:
+        """(Places id, document id) of every stored venue, or of those written since ``since``."""
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def event_exists(self, payment_portal: str) -> bool:
+        """Whether an event with this paymentPortal is stored."""
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def venue_document_id(self, place_id: str) -> Optional[str]:
+        """Document id of the stored venue with this Places id, if there is one."""
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def batch(self) -> StoreBatch:
+        """New batch of upserts; a single write is a batch of one."""
+        raise NotImplementedError("Subclasses must implement this method")
+
+
+class _FirestoreBatch(StoreBatch):
+
+    def __init__(self, db):
+        self.db = db
+        self.batch = db.batch()
+
+    def upsert_event(self, event_id: str, event: Dict[str, Any]) -> None:
+        self.batch.set(self.db.collection(EVENTS).document(event_id),
+                       {**event, UPDATED_FIELD: SERVER_TIMESTAMP}, merge=True)
+
+    def upsert_venue(self, venue_id: str, venue: Dict[str, Any]) -> None:
+        self.batch.set(self.db.collection(VENUES).document(venue_id),
+                       {**venue, UPDATED_FIELD: SERVER_TIMESTAMP}, merge=True)
+
+    def commit(self) -> None:
+        self.batch.commit()
+
+
+class FirestoreEventStore(EventStore):
+    """The events and whatstheplace collections in Firestore."""
+
+    def __init__(self, db, snapshot_path: Optional[str] = os.path.join(PROJECT_ROOT, '.firestore_index.json')):
+        self.db = db
+        self.snapshot_path = snapshot_path
+
+    def _query(self, collection: str, field: str, since: Optional[datetime]):
+        query = self.db.collection(collection)
+        if since is not None:
+            query = query.where(filter=FieldFilter(UPDATED_FIELD, ">=", since))
+        return query.select([field]).stream()
+
+    def event_portals(self, since: Optional[datetime] = None) -> Iterator[str]:
+        for doc in self._query(EVENTS, "paymentPortal", since):
+            portal = (doc.to_dict() or {}).get("paymentPortal")
+            if portal:
+                yield portal
+
+    def venue_ids(self, since: Optional[datetime] = None) -> Iterator[Tuple[str, str]]:
+        for doc in self._query(VENUES, "id", since):
+            place_id = (doc.to_dict() or {}).get("id")
+            if place_id:
+                yield place_id, doc.id
+
+    def event_exists(self, payment_portal: str) -> bool:
+        query = self.db.collection(EVENTS).where(filter=FieldFilter("paymentPortal", "==", payment_portal))
+        return bool(list(query.limit(1).stream()))
+
+    def venue_document_id(self, place_id: str) -> Optional[str]:
+        query = self.db.collection(VENUES).where(filter=FieldFilter("id", "==", place_id))
+        existing_venues = list(query.limit(1).stream())
+        return existing_venues[0].id if existing_venues else None
+
+    def batch(self) -> StoreBatch:
+        return _FirestoreBatch(self.db)
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Cannot store {type(value).__name__}")
+
+
+def _merge(stored: Dict[str, Any], update: Dict[str, Any]) -> Dict[str, Any]:
+    """set(merge=True) semantics: nested maps merge, everything else is replaced."""
+    for key, value in update.items():
+        if isinstance(value, dict) and isinstance(stored.get(key), dict):
+            _merge(stored[key], value)
+        else:
+            stored[key] = value
+    return stored
+
+
+class _SQLiteBatch(StoreBatch):
+
+    def __init__(self, store: 'SQLiteEventStore'):
+        self.store = store
+        self.writes: List[Tuple[str, str, Dict[str, Any]]] = []
+
+    def upsert_event(self, event_id: str, event: Dict[str, Any]) -> None:
+        self.writes.append((EVENTS, event_id, event))
+
+    def upsert_venue(self, venue_id: str, venue: Dict[str, Any]) -> None:
+        self.writes.append((VENUES, venue_id, venue))
+
+    def commit(self) -> None:
+        self.store._commit(self.writes)
+
+
+class SQLiteEventStore(EventStore):
+    """Events and venues as JSON documents in a local SQLite file."""
+
+    # Field the Firestore queries filter on, and its column, per table.
+    KEY_FIELDS = {EVENTS: 'paymentPortal', VENUES: 'id'}
+    KEY_COLUMNS = {EVENTS: 'payment_portal', VENUES: 'place_id'}
+
+    def __init__(self, path: str = DEFAULT_SQLITE_STORE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ':memory:':
+            self._db.execute('PRAGMA journal_mode=WAL')
+        for table, column in self.KEY_COLUMNS.items():
+            self._db.execute(
+                f'CREATE TABLE IF NOT EXISTS {table} ('
+                f'id TEXT PRIMARY KEY, {column} TEXT, data TEXT NOT NULL, updated_at REAL NOT NULL)')
+            self._db.execute(f'CREATE INDEX IF NOT EXISTS {table}_{column} ON {table} ({column})')
+            self._db.execute(f'CREATE INDEX IF NOT EXISTS {table}_updated_at ON {table} (updated_at)')
+
+    def _select(self, table: str, since: Optional[datetime]) -> List[Tuple[str, str]]:
+        column = self.KEY_COLUMNS[table]
+        sql = f'SELECT {column}, id FROM {table} WHERE {column} IS NOT NULL'
+        params: Tuple = ()
+        if since is not None:
+            sql += ' AND updated_at >= ?'
+            params = (since.timestamp(),)
+        with self._lock:
+            return self._db.execute(sql, params).fetchall()
+
+    def event_portals(self, since: Optional[datetime] = None) -> Iterator[str]:
+        return (portal for portal, _ in self._select(EVENTS, since))
+
+    def venue_ids(self, since: Optional[datetime] = None) -> Iterator[Tuple[str, str]]:
+        return iter(self._select(VENUES, since))
+
+    def event_exists(self, payment_portal: str) -> bool:
+        with self._lock:
+            row = self._db.execute('SELECT 1 FROM events WHERE payment_portal = ? LIMIT 1',
+                                   (payment_portal,)).fetchone()
+        return row is not None
+
+    def venue_document_id(self, place_id: str) -> Optional[str]:
+        with self._lock:
+            row = self._db.execute('SELECT id FROM whatstheplace WHERE place_id = ? LIMIT 1',
+                                   (place_id,)).fetchone()
+        return row[0] if row else None
+
+    def batch(self) -> StoreBatch:
+        return _SQLiteBatch(self)
+
+    def _commit(self, writes: List[Tuple[str, str, Dict[str, Any]]]) -> None:
+        now = time.time()
+        updated_at = datetime.fromtimestamp(now, timezone.utc)
+        with self._lock:
+            self._db.execute('BEGIN')
+            try:
+                for table, doc_id, document in writes:
+                    column = self.KEY_COLUMNS[table]
+                    row = self._db.execute(f'SELECT data FROM {table} WHERE id = ?', (doc_id,)).fetchone()
+                    stored = json.loads(row[0]) if row else {}
+                    data = _merge(stored, {**document, UPDATED_FIELD: updated_at})
+                    self._db.execute(
+                        f'INSERT OR REPLACE INTO {table} (id, {column}, data, updated_at) VALUES (?, ?, ?, ?)',
+                        (doc_id, data.get(self.KEY_FIELDS[table]),
+                         json.dumps(data, default=_encode), now))
+                self._db.execute('COMMIT')
+            except BaseException:
+                self._db.execute('ROLLBACK')
+                raise
+
+    def document(self, collection: str, doc_id: str) -> Optional[Dict[str, Any]]:
+        """A stored event or venue as it would read back from Firestore (dates as ISO strings)."""
+        with self._lock:
+            row = self._db.execute(f'SELECT data FROM {collection} WHERE id = ?', (doc_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
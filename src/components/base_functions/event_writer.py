@@ -0,0 +1,223 @@
+"""
+Buffered writes of events and their venues to an EventStore.
+
+save() runs the existence checks straight away but only queues the writes.
+They are committed in store batches (Firestore WriteBatches) once FLUSH_SIZE writes are waiting, once
+FLUSH_INTERVAL seconds have passed since the oldest queued write (a timer
+thread commits them then, even if no further save() comes), and on
+close(). An event and the new venue it points at always go into the same
+batch. If a batch commit fails, its events are committed one by one so the
+failure can be reported against the URL it came from.
+
+Documents get deterministic ids: an event's is a hash of its event_key and
+a venue's is its Places id. Every write is an idempotent upsert,
+so two jobs saving the same event concurrently end up with one document.
+Events that are already stored are skipped, and venues stored under older
+auto-generated ids are reused: with an ExistenceIndex these are set
+lookups (and every committed document is added to it), without one each
+save asks the store.
+"""
+
+import hashlib
+import threading
+import time
+from typing import Optional, Any, Dict, List
+
+from event_scraper.urls import canonical_url, event_key
+from src.components.base_functions.event_store import EventStore, StoreBatch
+from src.components.base_functions.existence_index import ExistenceIndex
+from src.logger import logging
+
+# Firestore accepts at most 500 writes in one batch.
+FLUSH_SIZE = 500
+FLUSH_INTERVAL = 5.0
+
+
+def event_document_id(payment_portal: str) -> str:
+    """Document id every writer derives for the event at ``payment_portal``."""
+    return hashlib.sha256(event_key(payment_portal).encode('utf-8')).hexdigest()[:32]
+
+
+class _PendingEvent:
+    """The writes queued for one event URL."""
+
+    def __init__(self, url: str, event_id: str, event_info: Dict[str, Any],
+                 venue_id: Optional[str] = None, venue: Optional[Dict[str, Any]] = None):
+        self.url = url
+        self.event_id = event_id
+        self.event_info = event_info
+        self.venue_id = venue_id
+        self.venue = venue
+
+    @property
+    def writes(self) -> int:
+        return 2 if self.venue is not None else 1
+
+    def add_to(self, batch: StoreBatch) -> None:
+        if self.venue is not None:
+            batch.upsert_venue(self.venue_id, self.venue)
+        batch.upsert_event(self.event_id, self.event_info)
+
+    def add_to_index(self, index: ExistenceIndex) -> None:
+        if self.venue is not None:
+            index.add_venue(self.venue['id'], self.venue_id)
+        index.add_event(self.event_info['paymentPortal'])
+
+
+class EventWriter:
+    """Queues event and venue writes and commits them in store batches."""
+
+    def __init__(self, store: EventStore, index: Optional[ExistenceIndex] = None,
+                 flush_size: int = FLUSH_SIZE, flush_interval: float = FLUSH_INTERVAL):
+        self.store = store
+        self.index = index
+        self.flush_size = min(flush_size, FLUSH_SIZE)
+        self.flush_interval = flush_interval
+        self.failures: Dict[str, str] = {}
+        self.commits = 0
+        self.writes = 0
+        self._pending: List[_PendingEvent] = []
+        self._pending_writes = 0
+        self._oldest: Optional[float] = None
+        self._timer: Optional[threading.Timer] = None
+        # save() and the flush timer both touch the queue
+        self._lock = threading.RLock()
+        # Places id -> venue document id, including venues not yet committed
+        self._venue_ids: Dict[str, str] = {}
+
+    def save(self, url: str, event_info: Dict[str, Any], establishment_details: Optional[Dict[str, Any]]) -> bool:
+        """Queue an event (and its venue, if new); False if it could not be checked."""
+        with self._lock:
+            return self._save(url, event_info, establishment_details)
+
+    def _save(self, url: str, event_info: Dict[str, Any], establishment_details: Optional[Dict[str, Any]]) -> bool:
+        try:
+            event_info['paymentPortal'] = canonical_url(event_info['paymentPortal'])
+            # Check if event already exists
+            if self._event_exists(event_info['paymentPortal']):
+                print(f"Event already exists: {event_info['name']}")
+                logging.info(f"Event already exists: {event_info['name']}")
+                return True
+
+            new_venue = venue_id = None
+            if establishment_details is not None:
+                venue_id = self._venue_id(establishment_details['id'])
+                if venue_id is None:
+                    new_venue = establishment_details
+                    venue_id = self._venue_ids[establishment_details['id']] = establishment_details['id']
+                    print(f"Adding new venue: {establishment_details['displayName']}")
+                    logging.info(f"Adding new venue: {establishment_details['displayName']}")
+                else:
+                    print(f"Using existing venue: {establishment_details['displayName']}")
+                    logging.info(f"Using existing venue: {establishment_details['displayName']}")
+                event_info['venueId'] = str(venue_id)
+
+            event_id = event_document_id(event_info['paymentPortal'])
+            pending = _PendingEvent(url, event_id, event_info, venue_id, new_venue)
+        except Exception as e:
+            print(f"Error saving {url}: {e}")
+            logging.info(f"Error saving {url}: {e}")
+            return False
+
+        if self._pending_writes + pending.writes > self.flush_size:
+            self.flush()
+        self._pending.append(pending)
+        self._pending_writes += pending.writes
+        if self._oldest is None:
+            self._oldest = time.monotonic()
+            self._timer = threading.Timer(self.flush_interval, self._flush_due)
+            self._timer.daemon = True
+            self._timer.start()
+        print(f"Queued new event: {event_info['name']}")
+        logging.info(f"Queued new event: {event_info['name']}")
+
+        if self._pending_writes >= self.flush_size or time.monotonic() - self._oldest >= self.flush_interval:
+            self.flush()
+        return True
+
+    def _flush_due(self) -> None:
+        """Timer callback: commit the queue if its oldest write has waited flush_interval."""
+        with self._lock:
+            if self._oldest is None or time.monotonic() - self._oldest < self.flush_interval:
+                return
+            try:
+                self.flush()
+            except Exception as e:
+                logging.info(f"Timed flush failed: {e}")
+
+    def _event_exists(self, payment_portal: str) -> bool:
+        if self.index is not None:
+            return self.index.has_event(payment_portal)
+        return self.store.event_exists(payment_portal)
+
+    def _venue_id(self, place_id: str) -> Optional[str]:
+        """Document id of the venue for a Places id, if it is stored or queued."""
+        venue_id = self._venue_ids.get(place_id)
+        if venue_id is None:
+            if self.index is not None:
+                venue_id = self.index.venue_id(place_id)
+            else:
+                venue_id = self.store.venue_document_id(place_id)
+            if venue_id is not None:
+                self._venue_ids[place_id] = venue_id
+        return venue_id
+
+    def flush(self) -> None:
+        """Commit every queued write."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            pending, self._pending = self._pending, []
+            self._pending_writes = 0
+            self._oldest = None
+            if pending:
+                self._commit(pending)
+
+    def _commit(self, pending: List[_PendingEvent]) -> None:
+        batch = self.store.batch()
+        for event in pending:
+            event.add_to(batch)
+        try:
+            batch.commit()
+        except Exception as e:
+            logging.info(f"Batch of {len(pending)} events failed ({e}), committing them one by one")
+        else:
+            self._committed(pending)
+            logging.info(f"Committed {len(pending)} events in one batch")
+            return
+
+        failed_venues = set()
+        for event in pending:
+            if event.venue is None and event.event_info.get('venueId') in failed_venues:
+                self._fail(event, "its venue could not be written")
+                continue
+            batch = self.store.batch()
+            event.add_to(batch)
+            try:
+                batch.commit()
+            except Exception as e:
+                if event.venue is not None:
+                    failed_venues.add(event.venue_id)
+                    # Let a later event try to create the venue again
+                    self._venue_ids.pop(event.venue['id'], None)
+                self._fail(event, str(e))
+            else:
+                self._committed([event])
+
+    def _committed(self, events: List[_PendingEvent]) -> None:
+        self.commits += 1
+        self.writes += sum(event.writes for event in events)
+        if self.index is not None:
+            for event in events:
+                event.add_to_index(self.index)
+
+    def _fail(self, event: _PendingEvent, reason: str) -> None:
+        self.failures[event.url] = reason
+        print(f"Error saving {event.url}: {reason}")
+        logging.info(f"Error saving {event.url}: {reason}")
+
+    def close(self) -> Dict[str, str]:
+        """Commit what is left; returns url -> error for every event that was not written."""
+        self.flush()
+        return self.failures
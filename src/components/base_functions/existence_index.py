@@ -0,0 +1,110 @@
+"""
+In-memory index of the events and venues already in the EventStore.
+
+Instead of querying the store once per event, the pipeline loads every
+event's paymentPortal and every venue's Places id (with its document id)
+once per run, projected down to those fields. The index is kept in a
+local snapshot, so the next run only asks for documents whose updatedAt
+(stamped by the EventStore) is newer than the previous load. Documents
+written by other clients carry no updatedAt, and deletions are not seen
+incrementally, so the snapshot is rebuilt from scratch after
+FULL_RELOAD_AGE.
+"""
+
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Set
+
+from event_scraper.urls import canonical_url
+from src.components.base_functions.event_store import EventStore
+from src.logger import logging
+
+FULL_RELOAD_AGE = timedelta(days=1)
+# Margin for the difference between this machine's clock and Firestore's.
+CLOCK_SKEW = timedelta(minutes=5)
+
+
+class ExistenceIndex:
+    """paymentPortal values of stored events and Places id -> document id of stored venues."""
+
+    def __init__(self, store: EventStore, max_age: timedelta = FULL_RELOAD_AGE):
+        self.store = store
+        self.path = store.snapshot_path
+        self.max_age = max_age
+        self.events: Set[str] = set()
+        self.venues: Dict[str, str] = {}
+        self.loaded_at: Optional[datetime] = None
+        self.full_loaded_at: Optional[datetime] = None
+        self.documents_read = 0
+
+    def load(self) -> 'ExistenceIndex':
+        """Bring the index up to date, incrementally if the snapshot is recent enough."""
+        started = datetime.now(timezone.utc)
+        self._read_snapshot()
+        if self.full_loaded_at is None or started - self.full_loaded_at > self.max_age:
+            self.events, self.venues = set(), {}
+            since = None
+            self.full_loaded_at = started
+        else:
+            since = self.loaded_at - CLOCK_SKEW
+
+        for portal in self.store.event_portals(since):
+            self.events.add(canonical_url(portal))
+            self.documents_read += 1
+        for place_id, venue_id in self.store.venue_ids(since):
+            self.venues.setdefault(place_id, venue_id)
+            self.documents_read += 1
+
+        self.loaded_at = started
+        logging.info(f"{'Incremental' if since else 'Full'} existence index load read {self.documents_read} "
+                     f"documents: {len(self.events)} events, {len(self.venues)} venues")
+        return self
+
+    def has_event(self, payment_portal: str) -> bool:
+        return canonical_url(payment_portal) in self.events
+
+    def venue_id(self, place_id: str) -> Optional[str]:
+        return self.venues.get(place_id)
+
+    def add_event(self, payment_portal: str) -> None:
+        self.events.add(canonical_url(payment_portal))
+
+    def add_venue(self, place_id: str, venue_id: str) -> None:
+        self.venues.setdefault(place_id, venue_id)
+
+    def _read_snapshot(self) -> None:
+        if not self.path:
+            return
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+            self.events = set(data['events'])
+            self.venues = dict(data['venues'])
+            self.loaded_at = datetime.fromisoformat(data['loaded_at'])
+            self.full_loaded_at = datetime.fromisoformat(data['full_loaded_at'])
+        except (OSError, ValueError, KeyError, TypeError):
+            self.events, self.venues = set(), {}
+            self.loaded_at = self.full_loaded_at = None
+
+    def save(self) -> None:
+        """Write the snapshot the next run loads incrementally from."""
+        if not self.path or self.loaded_at is None:
+            return
+        data = {
+            'loaded_at': self.loaded_at.isoformat(),
+            'full_loaded_at': self.full_loaded_at.isoformat(),
+            'events': sorted(self.events),
+            'venues': self.venues,
+        }
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as tmp:
+                json.dump(data, tmp)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
@@ -1,21 +1,14 @@
 from src.logger import logging 
-import re
+from event_scraper.urls import platform_for_url
 
 def identify_platform(url):
     """Identify the ticketing platform from URL."""
     logging.info("Identifying the ticketing platfrom from URL.")
-    patterns = {
-        'quicket': r'quicket',
-        'howler': r'howler',
-        'webtickets': r'webtickets',
-        'computicket': r'computicket',
-        'ticketpro': r'ticketpro'
-    }
+    platform = platform_for_url(url)
     
-    for platform, pattern in patterns.items():
-        if re.search(pattern, url, re.IGNORECASE):
-            logging.info(f"Platform identified {platform}")
-            return platform
+    if platform != 'unknown':
+        logging.info(f"Platform identified {platform}")
+        return platform
     
     logging.info(f"Platform is unknown")
-    return 'unknown'
\ No newline at end of file
+    return 'unknown'
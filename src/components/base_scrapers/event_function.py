@@ -0,0 +1,211 @@
+"""
+Event extractor for every platform.
+
+The event_scraper class for the URL fetches and parses the page once into an
+EventDetails; this module looks the venue up in Google Places and maps the
+record onto the Firestore events schema. It is the only place that knows
+that schema.
+
+A batch run scrapes all its pages concurrently with scrape_events and
+resolves venues separately: resolve_venues looks each distinct venue up
+once, on a small worker pool, and the results are shared by every event at
+that venue.
+"""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Optional, Any, Callable, Dict, Iterable, Tuple, Union
+
+from dotenv import load_dotenv
+
+from event_scraper.base_scraper import DEFAULT_MAX_CONCURRENCY, BaseScraper
+from event_scraper.dates import SAST, to_sast
+from event_scraper.models import EventDetails
+from event_scraper.places_cache import normalise_venue
+from event_scraper.urls import canonical_url
+from src.components.base_scrapers.places_function import get_place_id
+from src.logger import logging
+
+# Venue names on these platforms are too generic for Places on their own,
+# so the location goes into the query as well.
+COMBINED_VENUE_PLATFORMS = frozenset({'computicket', 'ticketpro'})
+
+# Webtickets pages only give a start time.
+WEBTICKETS_DURATION = timedelta(hours=4)
+
+# Places lookups in flight at once during a batch; stays under the
+# transport's default limits for maps.googleapis.com.
+PLACES_MAX_WORKERS = 8
+
+
+def place_query(event_details: EventDetails) -> Optional[str]:
+    """Text to look the event's venue up with in Places."""
+    venue, location = event_details.venue, event_details.location
+    if event_details.source in COMBINED_VENUE_PLATFORMS:
+        if venue and location:
+            return f"{venue}, {location}"
+        return venue or location
+    return venue
+
+
+def venue_key(event_details: EventDetails) -> Optional[str]:
+    """Key events at the same venue share for one Places lookup."""
+    query = place_query(event_details)
+    if not query:
+        return None
+    return normalise_venue(query) or None
+
+
+def establishment_from_place(place_info: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """whatstheplace document for the best Places candidate, if any."""
+    if not place_info or not place_info.get("candidates"):
+        return None
+    candidate = place_info["candidates"][0]
+    return {
+        "id": candidate['place_id'],
+        "formattedAddress": candidate['formatted_address'],
+        "location": candidate['geometry']['location'],
+        "displayName": candidate['name'],
+        "managerAccount": 'testAddEventEndpoint'
+    }
+
+
+def event_dates(event_details: EventDetails) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """SAST start and end as stored in Firestore."""
+    start_date = to_sast(event_details.start_date)
+    end_date = to_sast(event_details.end_date)
+    if event_details.source == 'webtickets':
+        if start_date is None:
+            # Fall back to today, 5pm to 9pm
+            today = datetime.now(SAST)
+            start_date = today.replace(hour=17, minute=0, second=0, microsecond=0)
+            end_date = today.replace(hour=21, minute=0, second=0, microsecond=0)
+        else:
+            end_date = start_date + WEBTICKETS_DURATION
+    return start_date, end_date
+
+
+def to_firestore_event(event_details: EventDetails, email: str) -> Dict[str, Any]:
+    """Firestore events document for an EventDetails."""
+    start_date, end_date = event_dates(event_details)
+    min_price = event_details.min_price
+    return {
+        'ageRestriction': '18 and older',
+        'artistNames': [],
+        'artists': [],
+        'description': event_details.description or '',
+        'endDate': end_date,
+        'genres': [],
+        'managerAccount': email,
+        'name': event_details.title,
+        # Howler's purchase link and Quicket's API url, as stored before
+        # the scrapers were unified, so existing events still match
+        'paymentPortal': str(event_details.payment_url or event_details.event_url),
+        'eventUrl': canonical_url(str(event_details.event_url)),
+        'price': float(min_price) if min_price is not None else 0,
+        'startDate': start_date,
+        'venue': "",  # will be filled with venueId if venue exists
+        'venueId': "",
+        'whatstheplace': "",
+        'eventImageUrl': str(event_details.image_url) if event_details.image_url else ''
+    }
+
+
+def _scraped(event_link: str, event_details: Optional[EventDetails]) -> Union[EventDetails, str]:
+    if not event_details:
+        return f'Could not extract event details from: {event_link}'
+    logging.info(f"Extracted {event_details.source} event: {event_details.title}")
+    return event_details
+
+
+def scrape_event(event_link: str, transport=None) -> Union[EventDetails, str]:
+    """EventDetails for an event page, or an error message string."""
+    try:
+        scraper = BaseScraper.get_scraper_for_url(event_link, transport)
+        event_details = scraper.scrape(event_link)
+    except Exception as e:
+        return f'Error extracting event from {event_link}: {str(e)}'
+    return _scraped(event_link, event_details)
+
+
+def scrape_events(event_links: Iterable[str], max_concurrency: int = DEFAULT_MAX_CONCURRENCY, transport=None,
+                  on_scraped: Optional[Callable[[str, Union[EventDetails, str]], None]] = None,
+                  on_started: Optional[Callable[[str], None]] = None
+                  ) -> Dict[str, Union[EventDetails, str]]:
+    """
+    Scrape many event pages concurrently with BaseScraper.extract_many.
+
+    Returns:
+        dict: event_link -> EventDetails or error message string. on_started
+        is called with the event_link as each page starts, and on_scraped
+        with the pair as each page finishes.
+    """
+    async def collect() -> Dict[str, Union[EventDetails, str]]:
+        results = {}
+        pages = BaseScraper.extract_many(event_links, max_concurrency, transport, on_started)
+        async for event_link, event_details in pages:
+            results[event_link] = _scraped(event_link, event_details)
+            if on_scraped is not None:
+                on_scraped(event_link, results[event_link])
+        return results
+
+    return asyncio.run(collect())
+
+
+def find_establishment(query: str, transport=None) -> Optional[Dict[str, Any]]:
+    """whatstheplace document for a Places query, None if there is no match."""
+    places_api_key = os.environ.get("PLACES_API")
+    if not places_api_key:
+        return None
+    try:
+        place_info = get_place_id(query, api_key=places_api_key, transport=transport)
+    except Exception as e:
+        print(f"Error looking up venue {query}: {e}")
+        logging.info(f"Error looking up venue {query}: {e}")
+        return None
+    return establishment_from_place(place_info)
+
+
+def resolve_venues(events: Iterable[EventDetails], max_workers: int = PLACES_MAX_WORKERS,
+                   transport=None) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Look each distinct venue of a batch up once, concurrently.
+
+    Returns:
+        dict: venue_key -> establishment_details (None if Places has no match)
+    """
+    load_dotenv()
+    queries = {}
+    for event_details in events:
+        key = venue_key(event_details)
+        if key:
+            queries.setdefault(key, place_query(event_details))
+    if not queries:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(queries))) as executor:
+        futures = {key: executor.submit(find_establishment, query, transport) for key, query in queries.items()}
+        return {key: future.result() for key, future in futures.items()}
+
+
+def event_extractor(event_link: str, email: str, transport=None,
+                    scraped: Optional[Union[EventDetails, str]] = None
+                    ) -> Union[Tuple[Dict[str, Any], Optional[Dict[str, Any]]], str]:
+    """
+    Scrape an event page (unless ``scraped`` already holds the scrape_events
+    result for it) and map it for Firestore.
+
+    Returns:
+        tuple: (event_info, establishment_details) or error message string
+    """
+    load_dotenv()
+    logging.info(f"Starting event extractor for {event_link}")
+
+    event_details = scraped if scraped is not None else scrape_event(event_link, transport)
+    if isinstance(event_details, str):
+        return event_details
+
+    query = place_query(event_details)
+    establishment_details = find_establishment(query, transport) if query else None
+    return to_firestore_event(event_details, email), establishment_details
@@ -1,7 +1,26 @@
 import requests
+from event_scraper.gazetteer import get_gazetteer
+from event_scraper.places_cache import get_places_cache, is_miss, normalise_venue
+from event_scraper.singleflight import SingleFlight
+from event_scraper.transport import get_transport
 
+# Concurrent lookups of the same venue name share one Places request.
+_inflight_lookups = SingleFlight()
 
-def get_place_id(name, api_key):
+
+def get_place_id(name, api_key, transport=None):
+    # Answer recurring venues from the persistent cache
+    found, place_info = get_places_cache().lookup(name)
+    if found:
+        return place_info
+    # Other spellings of a known venue resolve locally
+    place_info = get_gazetteer().lookup(name)
+    if place_info is not None:
+        return place_info
+    return _inflight_lookups.do(normalise_venue(name), _find_place, name, api_key, transport)
+
+
+def _find_place(name, api_key, transport=None):
     # Base URL
     base_url = "https://maps.googleapis.com/maps/api/place/findplacefromtext/json"
 
@@ -9,14 +28,23 @@ def get_place_id(name, api_key):
     params = {
         "input": name,
         "inputtype": "textquery",
-        "fields": "place_id,formatted_address,geometry,name",
+        "fields": "place_id,formatted_address,geometry,name,types",
         "key": api_key
     }
 
     # Send request and capture response
-    response = requests.get(base_url, params=params)
+    transport = transport or get_transport()
+    try:
+        response = transport.get(base_url, params=params)
+    except requests.RequestException as e:
+        # Retries are exhausted or the Places circuit is open: carry on without a venue
+        print(f"Error fetching place for {name}: {e}")
+        return None
     # Check if the request is successful
     if response.status_code == 200:
-        return response.json()
+        place_info = response.json()
+        if get_places_cache().store(name, place_info) and not is_miss(place_info):
+            get_gazetteer().add(name, place_info['candidates'][0])
+        return place_info
     else:
-        return None
\ No newline at end of file
+        return None
@@ -1,122 +0,0 @@
-import os
-from dotenv import load_dotenv
-from datetime import datetime, timezone, timedelta
-from src.components.base_scrapers.places_function import get_place_id
-from src.logger import logging
-from event_scraper.base_scraper import BaseScraper
-
-
-def webtickets_event_extractor(event_link, email):
-    """Extract Webtickets event information following the same pattern as Quicket/Howler."""
-    
-    load_dotenv()
-    logging.info("Starting webtickets extractor function")
-
-    try:
-        # Import the unified scraper for Webtickets
-        # import sys
-        # sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-        # from event_scraper.base_scraper import BaseScraper
-        
-        # Get the appropriate scraper and extract event details
-        logging.info("About to obtain the appropriate scraper")
-
-        scraper = BaseScraper.get_scraper_for_url(event_link)
-        logging.info("Obtained the appropriate scraper")
-
-        event_details = scraper.extract_event_details(event_link)
-        logging.info("Extracted the event details")
-        
-
-        if not event_details:
-            return f'Could not extract event details from: {event_link}'
-        
-        # Extract venue name for Places API
-        venue_name = event_details.venue
-        
-        # Get place information using Google Places API
-        places_api_key = os.environ.get("PLACES_API")
-        establishment_details = None
-        
-        if venue_name and places_api_key:
-            place_info = get_place_id(venue_name, api_key=places_api_key)
-            
-            if place_info is not None:
-                establishment_details = {
-                    "id": place_info["candidates"][0]['place_id'],
-                    "formattedAddress": place_info["candidates"][0]['formatted_address'],
-                    "location": place_info["candidates"][0]['geometry']['location'],
-                    "displayName": place_info["candidates"][0]['name'],
-                    "managerAccount": 'testAddEventEndpoint'
-                }
-        
-        # Extract price information
-        price = 0
-        if event_details.prices:
-            try:
-                # Extract numeric values from prices and get the minimum
-                numeric_prices = []
-                for price_info in event_details.prices:
-                    price_str = price_info.get('price', '0')
-                    price_num = ''.join(char for char in price_str if char.isdigit() or char == '.')
-                    if price_num:
-                        numeric_prices.append(float(price_num))
-                
-                price = min(numeric_prices) if numeric_prices else 0
-            except:
-                price = 0
-        
-        # Extract start date from webpage and add 4 hours for end date
-        if event_details.start_date:
-            # Use the extracted start date from webpage
-            start_date = datetime(
-                event_details.start_date.year, 
-                event_details.start_date.month, 
-                event_details.start_date.day,
-                event_details.start_date.hour,
-                event_details.start_date.minute,
-                tzinfo=timezone(timedelta(hours=2))
-            )
-            # Add 4 hours to start date to get end date
-            end_date = start_date + timedelta(hours=4)
-        else:
-            # Fallback to today's date with 5pm to 9pm times if no date found
-            today = datetime.now()
-            start_date = datetime(
-                today.year, 
-                today.month, 
-                today.day,
-                17, 0,  # 5:00 PM
-                tzinfo=timezone(timedelta(hours=2))
-            )
-            end_date = datetime(
-                today.year, 
-                today.month, 
-                today.day,
-                21, 0,  # 9:00 PM
-                tzinfo=timezone(timedelta(hours=2))
-            )
-        
-        # Create event object following the exact same structure as Quicket/Howler
-        event_info = {
-            'ageRestriction': '18 and older',
-            'artistNames': [],
-            'artists': [],
-            'description': event_details.description or '',
-            'endDate': end_date,  # Use the calculated end_date (9pm)
-            'genres': [],
-            'managerAccount': email,
-            'name': event_details.title,
-            'paymentPortal': str(event_details.event_url),
-            'price': price,
-            'startDate': start_date,  # Use the calculated start_date (5pm)
-            'venue': "",  # will be filled with venueId if venue exists
-            'venueId': "",
-            'whatstheplace': "",
-            'eventImageUrl': str(event_details.image_url) if event_details.image_url else ''
-        }
-        
-        return event_info, establishment_details
-        
-    except Exception as e:
-        return f'Error extracting Webtickets event: {str(e)}'
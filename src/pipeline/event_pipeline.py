@@ -7,26 +7,47 @@ from src.logger import logging
 from src.components.base_functions.get_event_urls import get_event_urls_from_users
 from src.components.base_functions.identify_platform import identify_platform
 from src.components.base_functions.initialize_firebase import initialize_firebase
-from src.components.base_functions.process_event_urls import process_event_url
+from src.components.base_functions.event_store import FirestoreEventStore
+from src.components.base_functions.event_writer import EventWriter
+from src.components.base_functions.existence_index import ExistenceIndex
+from src.components.base_scrapers.event_function import resolve_venues, scrape_events, to_firestore_event, venue_key
 from firebase_admin import storage
 from googleapiclient.http import MediaFileUpload
 # from google.oauth2.credentials import Credentials
 from src.logger import LOG_FILE, LOG_FILE_PATH
 from src.components.base_functions.get_drive_service import get_drive_service_uri, DRIVE_ID
+from event_scraper.gazetteer import get_gazetteer
+from event_scraper.places_cache import get_places_cache
+from event_scraper.transport import get_transport
+from event_scraper.urls import canonical_url, event_key
 # from src.components.base_functions.get_drive_service
 import os 
 from dotenv import load_dotenv
 
 load_dotenv()
 
-
-def eventPipeline(event_urls_from_form):
-    """Main function to process all events from Google Sheets."""
+# Manager account the pipeline's events are stored under.
+EMAIL = "testEndpoint"
+
+
+def eventPipeline(event_urls_from_form, store=None, progress=None):
+    """
+    Main function to process all events from Google Sheets.
+    Events go to Firestore unless another EventStore (e.g. a local
+    SQLiteEventStore) is given; logs are only uploaded for Firestore runs.
+    The pages are scraped concurrently; progress(index, total, url, status),
+    if given, is called with status 'processing' as each page starts and
+    'done' as it finishes, or 'skipped' for a URL on an unknown platform.
+    index and url are the submitted URL and its 1-based position in
+    event_urls_from_form; duplicates of an event are reported with it.
+    """
     print("=== Event Scraper - Main Process ===")
     logging.info("=== Event Scraper - Main Process ===")
-    # Initialize Firebase
-    print("Initializing Firebase...")
-    db = initialize_firebase()
+    upload_logs = store is None
+    if store is None:
+        # Initialize Firebase
+        print("Initializing Firebase...")
+        store = FirestoreEventStore(initialize_firebase())
     
     # Get event URLs from Google Sheets
     # print("Fetching event URLs from Google Sheets...")
@@ -40,23 +61,83 @@ def eventPipeline(event_urls_from_form):
         print("⚠️  No event URLs found or missing environment variables.")
         logging.info("⚠️  No event URLs found or missing environment variables.")
     
-    # Process each event URL
+    # Drop URLs that point at an event already in the batch, remembering
+    # where each was submitted for progress reports
+    unique_urls = {}
+    submitted = {}
+    for position, url in enumerate(event_urls, 1):
+        key = event_key(url)
+        unique_urls.setdefault(key, canonical_url(url))
+        submitted.setdefault(unique_urls[key], []).append((position, url))
+    if len(unique_urls) < len(event_urls):
+        print(f"Skipping {len(event_urls) - len(unique_urls)} duplicate event URLs")
+        logging.info(f"Skipping {len(event_urls) - len(unique_urls)} duplicate event URLs")
+    event_urls = list(unique_urls.values())
+    
+    # Scrape every event URL on a known platform concurrently
     print(f"Processing {len(event_urls)} events...")
     logging.info(f"Processing {len(event_urls)} events...")
     success_count = 0
     total_count = len(event_urls)
     
-    for index, url in enumerate(event_urls, 1):
-        print(f"\n--- Event {index}/{total_count} ---")
-        logging.info(f"\n--- Event {index}/{total_count} ---")
-        
+    def report(url, status):
+        if progress is not None:
+            for position, submitted_url in submitted[url]:
+                progress(position, len(event_urls_from_form), submitted_url, status)
+    
+    known_urls = []
+    for url in event_urls:
         # Identify platform using regex patterns (similar to your original logic)
         platform = identify_platform(url)
-        print(f"Platform identified: {platform}")
-        
-        # Process the event
-        if process_event_url(url, db):
+        print(f"Platform identified for {url}: {platform}")
+        if platform == 'unknown':
+            print(f"Unknown platform: {url}")
+            logging.info(f"Unknown platform: {url}")
+            report(url, 'skipped')
+            continue
+        known_urls.append(url)
+    
+    finished = 0
+    def scraped_one(url, result):
+        nonlocal finished
+        finished += 1
+        print(f"\n--- Event {finished}/{len(known_urls)} scraped: {url} ---")
+        logging.info(f"\n--- Event {finished}/{len(known_urls)} scraped: {url} ---")
+        report(url, 'done')
+    
+    results = scrape_events(known_urls, on_scraped=scraped_one,
+                            on_started=lambda url: report(url, 'processing')) if known_urls else {}
+    scraped = []
+    for url in known_urls:
+        event_details = results[url]
+        if isinstance(event_details, str):
+            print(f"Error: {event_details}")
+            logging.info(f"Error: {event_details}")
+            continue
+        scraped.append((url, event_details))
+    
+    # Resolve every distinct venue once, then share it across its events
+    with_venue = sum(1 for _, event_details in scraped if venue_key(event_details))
+    venues = resolve_venues(event_details for _, event_details in scraped)
+    print(f"Resolved {len(venues)} distinct venues for {with_venue} events "
+          f"({with_venue - len(venues)} Places lookups saved by deduplication)")
+    logging.info(f"Resolved {len(venues)} distinct venues for {with_venue} events "
+                 f"({with_venue - len(venues)} Places lookups saved by deduplication)")
+    
+    # Upload each event with its venue, committing the writes in batches
+    index = ExistenceIndex(store).load()
+    print(f"Existence index: {len(index.events)} events, {len(index.venues)} venues "
+          f"({index.documents_read} documents read)")
+    writer = EventWriter(store, index)
+    for url, event_details in scraped:
+        establishment_details = venues.get(venue_key(event_details))
+        if writer.save(url, to_firestore_event(event_details, EMAIL), establishment_details):
             success_count += 1
+    failures = writer.close()
+    index.save()
+    success_count -= len(failures)
+    print(f"Wrote {writer.writes} documents in {writer.commits} batch commits")
+    logging.info(f"Wrote {writer.writes} documents in {writer.commits} batch commits, failures: {failures}")
     
     print(f"\n=== Processing Complete ===")
     print(f"Successfully processed: {success_count}/{total_count} events")
@@ -64,6 +145,19 @@ def eventPipeline(event_urls_from_form):
     logging.info(f"\n=== Processing Complete ===")
     logging.info(f"Successfully processed: {success_count}/{total_count} events")
     logging.info(f"Failed: {total_count - success_count} events")
+    transport_stats = get_transport().stats()
+    logging.info(f"Transport stats: {transport_stats}")
+    for platform, circuit in transport_stats['circuits'].items():
+        print(f"Circuit {platform}: {circuit['state']} (opened {circuit['times_opened']}x, {circuit['rejected']} requests failed fast)")
+    places_stats = get_places_cache().stats()
+    gazetteer = get_gazetteer()
+    logging.info(f"Places cache stats: {places_stats}, gazetteer hits: {gazetteer.hits}, misses: {gazetteer.misses}")
+    print(f"Places cache: {places_stats['hits']} hits, {places_stats['negative_hits']} cached misses "
+          f"({places_stats['entries']} venues stored); gazetteer: {gazetteer.hits} fuzzy matches, "
+          f"{gazetteer.misses} lookups sent to Places")
+
+    if not upload_logs:
+        return success_count, total_count
 
     try:
         # initialize_firebase(credentials_path, bucket_name)
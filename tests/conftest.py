@@ -0,0 +1,43 @@
+import glob
+import os
+import sys
+
+import requests
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+def fixture_paths(platform):
+    """Saved pages of one platform, as <fixtures>/<platform>/*.html."""
+    return sorted(glob.glob(os.path.join(FIXTURES, platform, '*.html')))
+
+
+def read_fixture(platform, name):
+    with open(os.path.join(FIXTURES, platform, name), 'rb') as f:
+        return f.read()
+
+
+class FixtureTransport:
+    """Serves saved pages in place of HttpTransport; unknown URLs get a 404."""
+
+    cache = None
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.headers = {}
+        self.requested = []
+
+    def get(self, url, **kwargs):
+        self.requested.append(url)
+        response = requests.Response()
+        response.url = url
+        response.encoding = 'utf-8'
+        if url in self.pages:
+            response.status_code = 200
+            response._content = self.pages[url]
+        else:
+            response.status_code = 404
+            response._content = b''
+        return response
@@ -0,0 +1,72 @@
+import pytest
+
+from event_scraper.gazetteer import VenueGazetteer
+
+
+def place(place_id, name, address, types=None):
+    candidate = {'place_id': place_id, 'name': name, 'formatted_address': address,
+                 'geometry': {'location': {'lat': 0, 'lng': 0}}}
+    if types is not None:
+        candidate['types'] = types
+    return candidate
+
+
+LOCALITIES = [
+    place('jhb', 'Johannesburg', 'Johannesburg, South Africa', ['locality', 'political']),
+    # Cached before types were requested
+    place('cpt', 'Cape Town', 'Cape Town, South Africa'),
+    place('fourways', 'Fourways', 'Fourways, Sandton, South Africa'),
+]
+VENUES = [
+    place('montecasino', 'Montecasino', 'Montecasino Blvd, Fourways, Sandton, 2055, South Africa',
+          ['casino', 'point_of_interest', 'establishment']),
+    place('orbit', 'The Orbit', '81 De Korte St, Braamfontein, Johannesburg, 2001, South Africa',
+          ['bar', 'establishment']),
+    place('baxter', 'Baxter Theatre Centre', 'Main Rd, Rondebosch, Cape Town, 7700, South Africa'),
+    place('artscape', 'Artscape Theatre Centre', 'D.F. Malan St, Foreshore, Cape Town, 8001, South Africa'),
+]
+
+
+def build(places):
+    gazetteer = VenueGazetteer()
+    for candidate in places:
+        gazetteer.add(candidate['name'], candidate)
+    return gazetteer
+
+
+@pytest.fixture
+def gazetteer():
+    return build(LOCALITIES + VENUES)
+
+
+@pytest.mark.parametrize('query', [
+    'The Orbit, Johannesburg',
+    'Teatro at Montecasino, Fourways',
+    'Baxter Theatre, Cape Town',
+    'Artscape Theatre, Cape Town',
+    'Zoo Lake, Johannesburg',
+    'Jazz Club, Cape Town',
+    'Johannesburg Cape Town',
+])
+def test_unknown_venue_in_a_known_city_does_not_match(query):
+    # Only the city, or a venue the query merely mentions, is known
+    assert build(LOCALITIES + [VENUES[0]]).match(query) is None
+
+
+@pytest.mark.parametrize('query, place_id', [
+    ('The Baxter Theatre Centre', 'baxter'),
+    ('ARTSCAPE THEATRE CENTRE', 'artscape'),
+    ('Artscape Theatre Centre.', 'artscape'),
+    ('Baxter Theatre Centr', 'baxter'),
+    ('Artscape Theatre, Cape Town', 'artscape'),
+])
+def test_spellings_of_a_known_venue_match(gazetteer, query, place_id):
+    candidate, score = gazetteer.match(query)
+    assert candidate['place_id'] == place_id
+    assert score >= gazetteer.threshold
+
+
+def test_locality_matches_its_own_name_only(gazetteer):
+    assert gazetteer.match('Cape Town')[0]['place_id'] == 'cpt'
+    assert gazetteer.match('johannesburg')[0]['place_id'] == 'jhb'
+    assert gazetteer.match('Johannesburgg') is None
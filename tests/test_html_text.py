@@ -0,0 +1,58 @@
+import random
+
+import pytest
+from bs4 import BeautifulSoup
+
+from conftest import fixture_paths
+
+from event_scraper.html_text import html_to_text
+
+TEXTS = ['Live music', '  spaced  out  ', '\n', ' ', '\t\n ', 'R150 &amp; up', '&lt;b&gt;', 'caf&eacute;',
+         '&#39;quoted&#39;', '&nbsp;', 'a\xa0b', 'line\r\nbreak', 'Ünïcödé']
+TAGS = ['p', 'div', 'span', 'b', 'em', 'li', 'pre', 'textarea', 'script', 'style', 'template']
+
+
+def soup_text(markup):
+    """How descriptions were cleaned before html_to_text."""
+    return BeautifulSoup(markup, 'html.parser').get_text(separator="\n").replace("\xa0", " ").strip()
+
+
+def random_fragment(rng, depth=0):
+    parts = []
+    for _ in range(rng.randint(0, 5)):
+        roll = rng.random()
+        if roll < 0.45:
+            parts.append(rng.choice(TEXTS))
+        elif roll < 0.5:
+            parts.append('<br>' if rng.random() < 0.5 else '<br/>')
+        elif roll < 0.55:
+            parts.append('<!-- note -->')
+        elif roll < 0.58:
+            parts.append('<![CDATA[raw <text>]]>')
+        elif depth < 5:
+            tag = rng.choice(TAGS)
+            parts.append(f'<{tag} class="x">{random_fragment(rng, depth + 1)}</{tag}>')
+    return ''.join(parts)
+
+
+@pytest.mark.parametrize('platform', ['howler', 'webtickets', 'ticketpro', 'computicket'])
+def test_fixture_pages_match_soup(platform):
+    for path in fixture_paths(platform):
+        with open(path, encoding='utf-8') as f:
+            markup = f.read()
+        assert html_to_text(markup) == soup_text(markup), path
+
+
+@pytest.mark.parametrize('seed', range(500))
+def test_random_fragments_match_soup(seed):
+    markup = random_fragment(random.Random(seed))
+    assert html_to_text(markup) == soup_text(markup)
+
+
+def test_malformed_entities_decode_like_unescape():
+    assert html_to_text('&copy 2026 &amp Co') == '© 2026 & Co'
+
+
+def test_empty():
+    assert html_to_text(None) == ''
+    assert html_to_text('') == ''
@@ -0,0 +1,136 @@
+from datetime import datetime
+from decimal import Decimal
+
+from conftest import FixtureTransport, read_fixture
+
+from event_scraper.computicket_scraper import ComputicketScraper
+from event_scraper.howler_scraper import HowlerScraper
+from event_scraper.models import Price
+from event_scraper.ticketpro_scraper import TicketproScraper
+from event_scraper.webtickets_scraper import WebticketsScraper
+
+
+def scrape(scraper_class, url, platform, name, **extra_pages):
+    transport = FixtureTransport({url: read_fixture(platform, name), **extra_pages})
+    return scraper_class(transport).extract_event_details(url)
+
+
+def test_howler_event_and_ticket_pages():
+    url = 'https://www.howler.co.za/events/joburg-jazz-night'
+    ticket_url = 'https://ag.howler.co.za/ticket_order/new?event_id=84213'
+    details = scrape(HowlerScraper, url, 'howler', 'joburg-jazz-night.html',
+                     **{ticket_url: read_fixture('howler_tickets', 'joburg-jazz-night.html')})
+
+    assert details.title == 'Joburg Jazz Night'
+    assert details.description == (
+        'An evening of modern jazz with the Orbit house band and guests.\n'
+        'Doors open at 18:30. Dinner is served until 21:00 & the bar stays open late.\n'
+        'Strictly18+.')
+    assert (details.venue, details.location) == ('The Orbit', '81 De Korte St, Braamfontein, Johannesburg')
+    assert details.start_date == datetime(2026, 3, 14, 19, 0)
+    assert details.end_date == datetime(2026, 3, 14, 23, 30)
+    assert str(details.image_url) == 'https://res.cloudinary.com/howler/image/upload/joburg-jazz-night.jpg'
+    # Stored as paymentPortal, as Howler events always have been
+    assert str(details.payment_url) == ticket_url
+    assert details.prices == [
+        Price(amount=Decimal('180.00'), sold_out=True),
+        Price(amount=Decimal('250.00')),
+        Price(amount=Decimal('1600.00')),
+    ]
+
+
+def test_howler_without_ticket_page_has_no_prices():
+    url = 'https://www.howler.co.za/events/joburg-jazz-night'
+    details = scrape(HowlerScraper, url, 'howler', 'joburg-jazz-night.html')
+
+    assert details.title == 'Joburg Jazz Night'
+    assert details.prices == []
+
+
+def test_howler_structured_data_takes_sold_out_tiers_from_ticket_page():
+    url = 'https://www.howler.co.za/events/soweto-soul-sessions'
+    ticket_url = 'https://ag.howler.co.za/ticket_order/new?event_id=85120'
+    details = scrape(HowlerScraper, url, 'howler', 'soweto-soul-sessions.html',
+                     **{ticket_url: read_fixture('howler_tickets', 'soweto-soul-sessions.html')})
+
+    # Every field comes from JSON-LD, which lists both tiers as in stock
+    assert details.title == 'Soweto Soul Sessions'
+    assert (details.venue, details.location) == ('Soweto Theatre', 'Cnr Bolani and Race Course Rd, Jabavu, Soweto')
+    assert details.start_date == datetime(2026, 5, 2, 17, 0)
+    assert details.prices == [
+        Price(amount=Decimal('150.00'), sold_out=True),
+        Price(amount=Decimal('220.00')),
+    ]
+    assert details.min_price == Decimal('220.00')
+    assert str(details.payment_url) == ticket_url
+
+
+def test_howler_structured_data_prices_without_ticket_page():
+    url = 'https://www.howler.co.za/events/soweto-soul-sessions'
+    details = scrape(HowlerScraper, url, 'howler', 'soweto-soul-sessions.html')
+
+    assert details.prices == [
+        Price(amount=Decimal('150.00'), tier='Early Bird'),
+        Price(amount=Decimal('220.00'), tier='General'),
+    ]
+
+
+def test_webtickets_description_and_ticket_panels():
+    url = 'https://www.webtickets.co.za/v2/event.aspx?itemid=1503212'
+    details = scrape(WebticketsScraper, url, 'webtickets', 'cape-town-comedy-festival.html')
+
+    assert details.title == 'Cape Town Comedy Festival'
+    assert details.description == ("Six of South Africa's funniest comics share one stage for a single "
+                                   "night of stand-up.Age restriction: 16+. No under 16s allowed.")
+    assert (details.venue, details.location) == ('Baxter Theatre', 'Main Road, Rondebosch')
+    assert details.start_date == datetime(2026, 3, 21, 20, 0)
+    assert details.end_date is None
+    assert str(details.image_url) == 'https://content.webtickets.co.za/Images/ct-comedy-festival.jpg'
+    assert details.payment_url is None
+    # The lowest non-zero panel price; the R999 in the head's script is not page text
+    assert details.prices == [Price(amount=Decimal('220.00'))]
+
+
+def test_webtickets_fallbacks():
+    url = 'https://www.webtickets.co.za/v2/event.aspx?itemid=1509876'
+    details = scrape(WebticketsScraper, url, 'webtickets', 'stellenbosch-wine-walk.html')
+
+    assert details.title == 'Webtickets - Stellenbosch Wine Walk'
+    # First long div that is not a price line, with its "About" prefix removed
+    assert details.description == ('the walk: a guided nine kilometre stroll between four family-owned '
+                                   'estates in the Jonkershoek valley, with a tasting at every stop and '
+                                   'a long lunch under the oaks at the last one.')
+    assert (details.venue, details.location) == ('Lanzerac Wine Estate', 'Lanzerac Wine Estate')
+    assert details.start_date == datetime(2026, 4, 4, 9, 30)
+    assert str(details.image_url) == 'https://content.webtickets.co.za/Images/wine-walk-banner.jpg'
+    assert details.prices == [Price(amount=Decimal('450.00')), Price(amount=Decimal('275.00'))]
+
+
+def test_ticketpro():
+    url = 'https://www.ticketpro.co.za/portal/web/index.php/event/durban-food-fair'
+    details = scrape(TicketproScraper, url, 'ticketpro', 'durban-food-fair.html')
+
+    year = datetime.now().year
+    assert details.title == 'Durban Food & Wine Fair'
+    assert details.description == ('Sixty local restaurants, wine farms and craft brewers under one roof, '
+                                   'with live cooking demonstrations on the main stage all day.')
+    assert (details.venue, details.location) == ('Durban Exhibition Centre', 'Durban')
+    assert details.start_date == datetime(year, 4, 18, 11, 0)
+    assert details.end_date == datetime(year, 4, 18, 18, 0)
+    assert str(details.image_url) == 'https://media.ticketpro.co.za/events/durban-food-fair-og.jpg'
+    # The lowest realistic ZAR amount; the one in the head's script is not page text
+    assert details.prices == [Price(amount=Decimal('150.00'))]
+
+
+def test_computicket():
+    url = 'https://computicket.com/event/limpopo_music_festival/7421589'
+    details = scrape(ComputicketScraper, url, 'computicket', 'limpopo-music-festival.html')
+
+    assert details.title == 'Limpopo Music Festival'
+    assert details.description == 'Two stages of house, amapiano and maskandi on the banks of the river.'
+    assert (details.venue, details.location) == ('Polokwane Cricket Club', 'Polokwane, Limpopo, South Africa')
+    assert details.start_date == datetime(2026, 11, 28, 12, 0)
+    assert details.end_date == datetime(2026, 11, 29, 6, 0)
+    assert str(details.image_url) == 'https://images.computicket.com/events/limpopo-music-festival.jpg'
+    # Reported once, though every enclosing div and span holds the "start at" label
+    assert details.prices == [Price(amount=Decimal('200.00'), tier='Starting from')]
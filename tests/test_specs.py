@@ -0,0 +1,20 @@
+import pytest
+from bs4 import BeautifulSoup
+
+from conftest import fixture_paths
+
+from event_scraper.specs import PLATFORM_SPECS, build_tree
+from research.compare_specs import REFERENCES
+
+
+@pytest.mark.parametrize('platform', sorted(PLATFORM_SPECS))
+def test_spec_matches_soup_lookups(platform):
+    paths = fixture_paths(platform)
+    assert paths
+    for path in paths:
+        with open(path, 'rb') as f:
+            markup = f.read()
+        expected = REFERENCES[platform](BeautifulSoup(markup, 'lxml'))
+        actual, missing = PLATFORM_SPECS[platform].evaluate(build_tree(markup))
+        assert missing == []
+        assert {field: actual[field] for field in expected} == expected, path
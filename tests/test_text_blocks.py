@@ -0,0 +1,85 @@
+import random
+
+import pytest
+from bs4 import BeautifulSoup
+
+from conftest import FixtureTransport, fixture_paths
+
+from event_scraper.computicket_scraper import ComputicketScraper
+
+WORDS = ['venue', 'Ticket', 'R150', 'price', 'about', 'Date', 'night', 'É', 'ß', 'İstanbul', '&amp;', '&nbsp;']
+
+
+def parse_page(markup):
+    return ComputicketScraper(FixtureTransport({})).parse_page(markup)
+
+
+def block_texts(markup, name):
+    """What the scrapers computed per block before TextIndex."""
+    return [el.get_text(strip=True) for el in BeautifulSoup(markup, 'lxml').find_all(name)]
+
+
+def random_block(rng, depth):
+    parts = []
+    for _ in range(rng.randint(0, 4)):
+        roll = rng.random()
+        if roll < 0.45:
+            parts.append(rng.choice(['', ' ', '\n  ']) + ' '.join(rng.choices(WORDS, k=rng.randint(1, 6))))
+        elif roll < 0.55:
+            parts.append('<!-- ' + rng.choice(WORDS) + ' -->')
+        elif roll < 0.6:
+            parts.append('<script>var price = "R999";</script>')
+        elif roll < 0.63:
+            parts.append('<template><div>' + rng.choice(WORDS) + '</div></template>')
+        elif roll < 0.7:
+            parts.append('<span>' + rng.choice(WORDS) + '</span>')
+        elif roll < 0.8:
+            parts.append('<p>' + ' '.join(rng.choices(WORDS, k=rng.randint(0, 5))) + '</p>')
+        elif depth < 6:
+            parts.append('<div class="d">' + random_block(rng, depth + 1) + '</div>')
+    return ''.join(parts)
+
+
+def random_page(seed):
+    rng = random.Random(seed)
+    return f'<html><head><title>t</title></head><body>{random_block(rng, 0)}</body></html>'
+
+
+@pytest.mark.parametrize('platform', ['howler', 'webtickets', 'ticketpro', 'computicket'])
+def test_fixture_blocks_match_get_text(platform):
+    for path in fixture_paths(platform):
+        with open(path, 'rb') as f:
+            markup = f.read()
+        index = parse_page(markup).text_blocks
+        for name in ('div', 'p', 'span'):
+            assert [index.text_of(span) for span in index.blocks(name)] == block_texts(markup, name), path
+
+
+@pytest.mark.parametrize('seed', range(200))
+def test_random_blocks_match_get_text(seed):
+    markup = random_page(seed)
+    page = parse_page(markup)
+    for name in ('div', 'p', 'span'):
+        expected = block_texts(markup, name)
+        spans = list(page.text_blocks.blocks(name))
+        assert [page.text_blocks.text_of(span) for span in spans] == expected
+        for keyword in ('venue', 'ticket', 'r150', 'i̇stanbul'):
+            assert [page.text_blocks.contains(span, keyword) for span in spans] == \
+                [keyword in text.lower() for text in expected]
+    assert page.paragraphs == block_texts(markup, 'p')
+    assert [page.text_blocks.text_of(span) for span in page.text_blocks.blocks('div', 'span')] == \
+        block_texts(markup, ['div', 'span'])
+
+
+@pytest.mark.parametrize('seed', range(50))
+def test_find_block_matches_scan(seed):
+    markup = random_page(seed)
+    index = parse_page(markup).text_blocks
+    exclude = ('ticket', 'price')
+
+    expected = None
+    for text in block_texts(markup, 'div'):
+        if len(text) > 20 and not text.startswith('R') and not any(k in text.lower() for k in exclude):
+            expected = text
+            break
+    assert index.find_block('div', longer_than=20, exclude=exclude, exclude_prefix='R') == expected